@@ -5,9 +5,12 @@ import datetime
 import logging
 import json
 import re
+from operator import attrgetter
 from typing import Optional
+from urllib.parse import urlsplit, urlunsplit
 from pydantic import BaseModel
 import arxiv
+import requests
 from .file_locations import FILE_LOCATIONS, FileLocations
 from .project_types import PaperMetadata
 from . import constants
@@ -128,10 +131,10 @@ def get_paper_metadata(arxiv_id: str, file_locations:Optional[str]=None) -> Pape
 
     if exists(cache_file):
         try:
-            with open(cache_file, 'r', encoding='utf-8') as f:
-                cached_data = json.load(f)
-            return PaperMetadata.model_validate(cached_data)
-        except (json.JSONDecodeError, ValueError) as e:
+            # Parse and validate in one step with pydantic's native JSON parser
+            with open(cache_file, 'rb') as f:
+                return PaperMetadata.model_validate_json(f.read())
+        except (OSError, ValueError) as e:
             logging.warning(f"Failed to load cached metadata for {arxiv_id}: {e}")
             # Continue to fetch from arXiv if cache is corrupted
 
@@ -173,9 +176,80 @@ def get_paper_metadata(arxiv_id: str, file_locations:Optional[str]=None) -> Pape
     return metadata
 
 
+def load_cached_paper_metadata(paper_ids: list[str], file_locations: Optional[FileLocations]=None) -> dict[str, PaperMetadata]:
+    """Load the locally cached metadata for several papers with a single scan of
+    the metadata cache directory.
+
+    Unlike get_paper_metadata(), this never contacts arXiv: papers with no cached
+    metadata, or whose cache file cannot be read, are left out of the result and
+    can be fetched individually with get_paper_metadata().
+
+    Parameters
+    ----------
+    paper_ids : list[str]
+        The arXiv paper identifiers to look up
+    file_locations: Optional[FileLocations]
+        File location object used to obtain path for metadata cache directory.
+        If not provided, defaults to file_locations.FILE_LOCATIONS.
+
+    Returns
+    -------
+    dict[str, PaperMetadata]
+        Cached metadata keyed by paper id
+    """
+    if file_locations is None:
+        from .file_locations import FILE_LOCATIONS
+        file_locations = FILE_LOCATIONS
+
+    wanted = set(paper_ids)
+    found: dict[str, PaperMetadata] = {}
+    if not os.path.isdir(file_locations.paper_metadata_dir):
+        return found
+    with os.scandir(file_locations.paper_metadata_dir) as entries:
+        for entry in entries:
+            if not entry.name.endswith('.json'):
+                continue
+            paper_id = entry.name[:-len('.json')]
+            if paper_id not in wanted:
+                continue
+            try:
+                with open(entry.path, 'rb') as f:
+                    found[paper_id] = PaperMetadata.model_validate_json(f.read())
+            except (OSError, ValueError) as e:
+                logging.warning(f"Failed to load cached metadata for {paper_id}: {e}")
+    return found
+
+
+# ArXiv asks automated clients to fetch from the export mirror rather than the
+# main site; see https://info.arxiv.org/help/bulk_data.html
+ARXIV_EXPORT_HOST = "export.arxiv.org"
+
+# Shared across downloads so repeated fetches reuse the same keep-alive
+# connection instead of paying a TCP+TLS handshake per paper
+_HTTP_SESSION = requests.Session()
+
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+_DOWNLOAD_TIMEOUT_SECONDS = 60
+
+# Sort key for returning candidates in paper ID order
+_BY_PAPER_ID = attrgetter('paper_id')
+
+
+def _export_pdf_url(pdf_url: str) -> str:
+    """Rewrite an arxiv.org PDF url to point at the export mirror."""
+    parts = urlsplit(pdf_url)
+    if parts.hostname not in ("arxiv.org", "www.arxiv.org"):
+        return pdf_url
+    return urlunsplit(("https", ARXIV_EXPORT_HOST, parts.path, parts.query, parts.fragment))
+
+
 def download_paper(paper_metadata: PaperMetadata, file_locations=None) -> str:
     """Download a paper's PDF to the local filesystem given its metadata.
-    
+
+    The PDF is fetched from the ArXiv export mirror over a shared HTTP session
+    and streamed to a temporary file that is renamed into place once complete,
+    so an interrupted download never leaves a truncated PDF behind.
+
     Parameters
     ----------
     paper_metadata : PaperMetadata
@@ -190,24 +264,30 @@ def download_paper(paper_metadata: PaperMetadata, file_locations=None) -> str:
         
     Raises
     ------
-    Exception
+    requests.RequestException
         If the PDF cannot be downloaded
     """
     if file_locations is None:
         from .file_locations import FILE_LOCATIONS
         file_locations = FILE_LOCATIONS
-        
-    client = arxiv.Client()
-    search_by_id = arxiv.Search(id_list=[paper_metadata.paper_id])
-    result = next(client.results(search_by_id))
-    
+
     local_pdf_path = paper_metadata.get_local_pdf_path(file_locations)
     
     if not exists(local_pdf_path):
         file_locations.ensure_pdfs_dir()
-        result.download_pdf(dirpath=file_locations.pdfs_dir, filename=basename(local_pdf_path))
-        assert exists(local_pdf_path)
-        logging.info(f"Downloaded '{paper_metadata.title}' to {local_pdf_path}")
+        pdf_url = _export_pdf_url(paper_metadata.paper_pdf_url)
+        tmp_path = local_pdf_path + '.part'
+        try:
+            with _HTTP_SESSION.get(pdf_url, stream=True, timeout=_DOWNLOAD_TIMEOUT_SECONDS) as response:
+                response.raise_for_status()
+                with open(tmp_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
+            os.replace(tmp_path, local_pdf_path)
+        finally:
+            if exists(tmp_path):
+                os.remove(tmp_path)
+        logging.info(f"Downloaded '{paper_metadata.title}' from {pdf_url} to {local_pdf_path}")
     else:
         logging.info(f"PDF file for '{paper_metadata.title}' already exists at {local_pdf_path}")
     
@@ -413,7 +493,7 @@ def search_arxiv_papers(query:str, k:int=constants.ARXIV_SEARCH_RESULT_COUNT, ca
     # If we have fewer candidates than requested, sort by paper ID and return all of them
     if len(candidates) <= k:
         # Sort by paper ID (ascending)
-        return sorted(candidates, key=lambda p: p.paper_id)
+        return sorted(candidates, key=_BY_PAPER_ID)
     
     try:
         # Try to use LlamaIndex embeddings for semantic similarity
@@ -429,15 +509,16 @@ def search_arxiv_papers(query:str, k:int=constants.ARXIV_SEARCH_RESULT_COUNT, ca
         
         # Create embeddings for each candidate paper
         # We'll embed the combination of title and abstract for better semantic matching
-        candidate_embeddings = []
+        texts_to_embed = []
         for candidate in candidates:
             # Combine title and abstract for richer semantic representation
             text_to_embed = f"{candidate.title}"
             if candidate.abstract:
                 text_to_embed += f" {candidate.abstract}"
-            
-            paper_embedding = embed_model.get_text_embedding(text_to_embed)
-            candidate_embeddings.append(paper_embedding)
+            texts_to_embed.append(text_to_embed)
+        
+        # One batched request for all the candidates instead of one per paper
+        candidate_embeddings = embed_model.get_text_embedding_batch(texts_to_embed)
         
         # Compute cosine similarities between query and candidate embeddings
         similarities = []
@@ -461,7 +542,7 @@ def search_arxiv_papers(query:str, k:int=constants.ARXIV_SEARCH_RESULT_COUNT, ca
         reranked_candidates = [candidates[i] for i in top_k_indices]
 
         # Sort by paper ID (ascending) for consistent ordering
-        return sorted(reranked_candidates, key=lambda p: p.paper_id)
+        return sorted(reranked_candidates, key=_BY_PAPER_ID)
         
     except Exception as e:
         # Fallback to simple text-based similarity if embeddings fail
@@ -500,7 +581,7 @@ def search_arxiv_papers(query:str, k:int=constants.ARXIV_SEARCH_RESULT_COUNT, ca
         reranked_candidates = [candidates[i] for i in top_k_indices]
 
         # Sort by paper ID (ascending) for consistent ordering
-        return sorted(reranked_candidates, key=lambda p: p.paper_id)
+        return sorted(reranked_candidates, key=_BY_PAPER_ID)
     
 def get_downloaded_paper_ids(file_locations:FileLocations=FILE_LOCATIONS) -> list[str]:
     """Return the list of paper ids for papers whose pdfs have been downloaded"""
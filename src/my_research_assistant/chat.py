@@ -25,6 +25,7 @@ from rich.layout import Layout
 from .workflow import WorkflowRunner, ResearchAssistantWorkflow
 from .models import get_default_model
 from .file_locations import FILE_LOCATIONS
+from .vector_store import warm_indexes
 from .project_types import PaperMetadata
 from .interface_adapter import TerminalAdapter
 from .validate_store import print_store_validation
@@ -67,6 +68,10 @@ class ChatInterface:
             
             # Initialize workflow runner with terminal adapter
             self.workflow_runner = WorkflowRunner(llm=self.llm, interface=self.interface_adapter, file_locations=FILE_LOCATIONS)
+
+            # Open the indexes now so the first search or research query is not slowed down
+            with self.console.status("[bold green]Loading indexes..."):
+                warm_indexes(FILE_LOCATIONS)
             
             self.console.print("✅ [bold green]Initialization complete![/bold green]")
             return True
@@ -476,7 +481,9 @@ You can continue working with this paper or start a new query."""
         self.current_state = "semantic_searching"
 
         try:
-            result = await self.workflow_runner.start_semantic_search_workflow(query)
+            # Show the answer as it streams in; the final version is rendered below
+            with self.interface_adapter.stream_context("🔍 Semantic Search") as on_chunk:
+                result = await self.workflow_runner.start_semantic_search_workflow(query, on_chunk=on_chunk)
 
             # Handle the new QueryResult format
             if hasattr(result, 'success'):
@@ -848,7 +855,7 @@ You can continue working with this paper or start a new query."""
             result = await self.workflow_runner.process_paper_selection(paper)
 
             # Handle the result and update state machine
-            if hasattr(result, 'paper') and hasattr(result, 'summary'):
+            if result.error is None:
                 # Store the summary in state machine with new conditional logic
                 self.state_machine.transition_after_summarize(result.paper, result.summary)
 
@@ -860,7 +867,7 @@ You can continue working with this paper or start a new query."""
                 self.interface_adapter.show_info("• Use 'improve <feedback>' to refine the summary")
                 self.interface_adapter.show_info("• Use 'notes' to edit your personal notes")
             else:
-                self.interface_adapter.show_error("Failed to generate summary")
+                self.interface_adapter.show_error(result.error)
 
         except Exception as e:
             self.interface_adapter.show_error(f"Summarize failed: {str(e)}")
@@ -882,8 +889,8 @@ You can continue working with this paper or start a new query."""
                 self.interface_adapter.show_error(error_msg)
                 return
 
-            # Load existing summary
-            success, content = load_paper_summary(paper.paper_id, FILE_LOCATIONS)
+            # Load existing summary off the event loop, as the workflow runner does
+            success, content = await asyncio.to_thread(load_paper_summary, paper.paper_id, FILE_LOCATIONS)
             if not success:
                 # Summary is missing - offer to create one
                 self.console.print(f"📄 [yellow]Summary not found for paper:[/yellow] {paper.title}")
@@ -925,7 +932,7 @@ You can continue working with this paper or start a new query."""
             result = await self.workflow_runner.process_paper_selection(paper)
 
             # Handle the result and update state machine
-            if hasattr(result, 'paper') and hasattr(result, 'summary'):
+            if result.error is None:
                 # Store the summary in state machine
                 self.state_machine.transition_after_summarize(result.paper, result.summary)
 
@@ -938,7 +945,7 @@ You can continue working with this paper or start a new query."""
                 self.interface_adapter.show_info("• Use 'improve <feedback>' to refine the summary")
                 self.interface_adapter.show_info("• Use 'notes' to edit your personal notes")
             else:
-                self.interface_adapter.show_error("Failed to generate summary")
+                self.interface_adapter.show_error(result.error)
 
         except Exception as e:
             self.interface_adapter.show_error(f"Summary creation failed: {str(e)}")
@@ -1129,12 +1136,15 @@ The content has been saved to your results directory and can be referenced later
 
                 # Use workflow to improve content
                 print(f"🔄 Improving {content_type} results based on feedback: '{feedback}'...")
-                result = await self.workflow_runner.improve_content(
-                    self.state_machine.state_vars.draft,
-                    feedback,
-                    content_type,
-                    original_query
-                )
+                # Show the response as it streams in; the final version is rendered below
+                with self.interface_adapter.stream_context(f"🔄 Improved {content_type.title()} Results") as on_chunk:
+                    result = await self.workflow_runner.improve_content(
+                        self.state_machine.state_vars.draft,
+                        feedback,
+                        content_type,
+                        original_query,
+                        on_chunk=on_chunk
+                    )
 
                 if hasattr(result, 'content'):
                     # Update the draft content
@@ -1155,8 +1165,10 @@ The content has been saved to your results directory and can be referenced later
     async def process_research_command(self, query: str):
         """Process a research command using hierarchical RAG workflow."""
         try:
-            # Use the research_query method for deep research
-            result = await self.workflow_runner.research_query(query)
+            # Use the research_query method for deep research, showing the
+            # synthesis as it streams in; the final version is rendered below
+            with self.interface_adapter.stream_context("🔬 Research") as on_chunk:
+                result = await self.workflow_runner.research_query(query, on_chunk=on_chunk)
 
             # Handle the new QueryResult format
             if hasattr(result, 'success'):
@@ -134,7 +134,7 @@ def main():
     saved_embed_model = Settings.embed_model
 
     # Import non-standard library modules AFTER logging is configured
-    from my_research_assistant.models import get_default_model, DEFAULT_MODEL, DEFAULT_EMBEDDING_MODEL, MODEL_API_BASE
+    from my_research_assistant.models import get_default_model, DEFAULT_MODEL, DEFAULT_EMBEDDING_MODEL, MODEL_API_BASE, EMBEDDING_API_BASE
 
     # Restore the saved embed_model (in case it was mocked in tests)
     Settings.embed_model = saved_embed_model
@@ -170,7 +170,7 @@ def main():
     print()  # Blank line between tests
 
     # Test embedding model
-    print(f"Testing embedding model (model: {DEFAULT_EMBEDDING_MODEL}, api_base: {MODEL_API_BASE}, timeout: {args.timeout}s)...")
+    print(f"Testing embedding model (model: {DEFAULT_EMBEDDING_MODEL}, api_base: {EMBEDDING_API_BASE}, timeout: {args.timeout}s)...")
     try:
         # Get embed_model from Settings (imported at module level)
         embed_model = Settings.embed_model
@@ -190,7 +190,7 @@ def main():
             all_passed = False
     except Exception as e:
         print(f"❌ Embedding model test failed: {e}")
-        suggestions = _get_error_suggestions(e, MODEL_API_BASE)
+        suggestions = _get_error_suggestions(e, EMBEDDING_API_BASE)
         print(f"  Suggestions:\n  {suggestions}")
         if args.verbose:
             print("\nFull traceback:")
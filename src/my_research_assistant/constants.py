@@ -28,6 +28,21 @@ GOOGLE_SEARCH_RESULT_COUNT = 10
 # Higher values provide more candidates for semantic reranking but increase API latency.
 ARXIV_CANDIDATE_LIMIT = 50
 
+# Maximum number of papers whose metadata is fetched from ArXiv at the same time
+# when listing papers that are missing from the local metadata cache.
+ARXIV_METADATA_CONCURRENCY = 4
+
+# Maximum number of embedding requests in flight at once when indexing a paper
+# whose chunks do not fit in a single batch of EMBEDDING_BATCH_SIZE.
+EMBEDDING_CONCURRENCY = 4
+
+# Maximum number of recent 'find' queries whose ArXiv results are kept in memory,
+# so that re-running the same search does not hit the (slow, rate-limited) API again.
+ARXIV_SEARCH_CACHE_MAX_ENTRIES = 256
+
+# Seconds a cached ArXiv search result stays valid.
+ARXIV_SEARCH_CACHE_TTL_SECONDS = 300
+
 
 # === CONTENT INDEX SEARCH CONSTANTS ===
 
@@ -85,3 +100,19 @@ RESEARCH_DETAIL_CHUNKS = 10
 # Applied during Stage 2 when searching detailed content within identified papers.
 # Uses same threshold as summary search for consistency.
 RESEARCH_CONTENT_SIMILARITY_CUTOFF = 0.5
+
+# Similarity above which a single Stage 1 summary match is treated as an exact hit.
+# The paper's summary is then returned as the answer, skipping Stage 2 and the
+# LLM synthesis. High, since the summary is returned verbatim.
+RESEARCH_DIRECT_ANSWER_SIMILARITY = 0.95
+
+
+# === SEARCH ANSWER CACHE CONSTANTS ===
+
+# Maximum number of semantic search answers kept in memory, so that repeating a
+# query against an unchanged index skips retrieval and the LLM. Least recently
+# used entries are evicted first once the cache is full.
+SEARCH_ANSWER_CACHE_MAX_ENTRIES = 500
+
+# Seconds a cached search answer stays valid.
+SEARCH_ANSWER_CACHE_TTL_SECONDS = 3600
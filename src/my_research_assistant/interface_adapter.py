@@ -49,12 +49,15 @@ This ensures consistent behavior regardless of the underlying UI technology.
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, List, Any, Dict
+from typing import Callable, Optional, List, Any, Dict, Iterator
 from rich.console import Console
 from rich.panel import Panel
 from rich.markdown import Markdown
 from rich.live import Live
 from rich.status import Status
+from rich.table import Table
+from rich.text import Text
+from rich.prompt import Prompt
 from contextlib import contextmanager
 
 from .project_types import PaperMetadata
@@ -107,6 +110,14 @@ class InterfaceAdapter(ABC):
         finally:
             pass
 
+    @contextmanager
+    def stream_context(self, title: Optional[str] = None) -> Iterator[Optional[Callable[[str], None]]]:
+        """Context manager for content generated incrementally (e.g. a streamed LLM
+        response). Yields a callback to pass each text delta to, or None if this
+        interface does not display partial content. The final content should still
+        be shown with render_content once the stream completes."""
+        yield None
+
 
 class TerminalAdapter(InterfaceAdapter):
     """Rich terminal implementation of the interface adapter."""
@@ -172,8 +183,6 @@ class TerminalAdapter(InterfaceAdapter):
             self.show_error("No papers found")
             return
         
-        from rich.table import Table
-        
         table = Table(title=f"📄 Found {len(papers)} Paper(s)")
         table.add_column("#", style="cyan", width=3)
         table.add_column("Title", style="white", max_width=50)
@@ -184,20 +193,13 @@ class TerminalAdapter(InterfaceAdapter):
         for i, paper in enumerate(papers, 1):
             # Truncate long titles and author lists
             title = paper.title[:47] + "..." if len(paper.title) > 50 else paper.title
-            authors = ", ".join(paper.authors[:2])
-            if len(paper.authors) > 2:
-                authors += f" + {len(paper.authors) - 2} more"
-            
-            categories = ", ".join(paper.categories[:2])
-            if len(paper.categories) > 2:
-                categories += "..."
                 
             table.add_row(
                 str(i),
                 title,
-                authors,
-                paper.published.strftime('%Y-%m-%d'),
-                categories
+                paper.display_authors_with_count,
+                paper.published.date().isoformat(),
+                paper.display_categories
             )
         
         self.console.print(table)
@@ -209,8 +211,6 @@ class TerminalAdapter(InterfaceAdapter):
     
     async def get_user_input(self, prompt: str, options: Optional[List[str]] = None) -> str:
         """Get user input with Rich prompt."""
-        from rich.prompt import Prompt
-        
         if options:
             prompt_text = f"{prompt} ({'/'.join(options)})"
         else:
@@ -230,6 +230,22 @@ class TerminalAdapter(InterfaceAdapter):
             status.stop()
             self._current_status = None
 
+    @contextmanager
+    def stream_context(self, title: Optional[str] = None) -> Iterator[Optional[Callable[[str], None]]]:
+        """Show the streamed text as plain text in a titled, transient live panel
+        that is cleared on exit. Deltas are appended to one Text object, which Live
+        redraws at its own refresh rate, so each delta costs an append rather than
+        a re-parse of the whole response as markdown."""
+        if self._current_status:
+            self._current_status.stop()
+            self._current_status = None
+        streamed = Text()
+        panel = Panel(streamed, title=title or "📝 Response", border_style="green")
+        with Live(panel, console=self.console, transient=True, vertical_overflow="visible"):
+            def show_chunk(delta: str):
+                streamed.append(delta)
+            yield show_chunk
+
 
 class WebAdapter(InterfaceAdapter):
     """Web interface adapter (placeholder for future implementation)."""
@@ -288,6 +304,12 @@ class WebAdapter(InterfaceAdapter):
             # Future: emit to websocket
             pass
     
+    @contextmanager
+    def stream_context(self, title: Optional[str] = None) -> Iterator[Optional[Callable[[str], None]]]:
+        def emit_chunk(delta: str):
+            self.events.append({"type": "content_delta", "content": delta, "title": title})
+        yield emit_chunk
+
     async def get_user_input(self, prompt: str, options: Optional[List[str]] = None) -> str:
         # Future: handle via websocket/HTTP request
         event = {
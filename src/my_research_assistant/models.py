@@ -13,14 +13,19 @@ DEFAULT_REASONING_MODEL = os.environ.get('DEFAULT_REASONING_MODEL', 'gpt-5.1')
 DEFAULT_EMBEDDING_MODEL = os.environ.get('DEFAULT_EMBEDDING_MODEL', 'text-embedding-ada-002')
 MODEL_API_BASE = os.environ.get('MODEL_API_BASE', 'https://api.openai.com/v1')
 MODEL_API_KEY = os.environ.get('OPENAI_API_KEY')
+# Embeddings can be served from a separate OpenAI-compatible endpoint (for example
+# a local Infinity or TEI server) that batches requests across documents.
+EMBEDDING_API_BASE = os.environ.get('EMBEDDING_API_BASE', MODEL_API_BASE)
+EMBEDDING_BATCH_SIZE = int(os.environ.get('EMBEDDING_BATCH_SIZE', '100'))
 assert MODEL_API_KEY is not None and MODEL_API_KEY!="", "Need to set environment variable OPENAI_API_KEY"
 
 # Configure the global embedding model for LlamaIndex
 # This model is used for all vector indexing and retrieval operations
 Settings.embed_model = OpenAIEmbedding(
     model=DEFAULT_EMBEDDING_MODEL,
-    api_base=MODEL_API_BASE,
-    api_key=MODEL_API_KEY
+    api_base=EMBEDDING_API_BASE,
+    api_key=MODEL_API_KEY,
+    embed_batch_size=EMBEDDING_BATCH_SIZE
 )
 
 _CACHED_MODEL:Optional[LLM] = None
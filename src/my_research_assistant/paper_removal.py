@@ -80,6 +80,10 @@ def remove_paper_from_indexes(paper_id: str, file_locations: FileLocations = FIL
             # If collection doesn't exist or other error, just continue
             print(f"Note: Could not access summary index: {e}")
 
+    if content_chunks_removed or summary_chunks_removed:
+        from .vector_store import bump_index_generation
+        bump_index_generation()
+
     return content_chunks_removed, summary_chunks_removed
 
 
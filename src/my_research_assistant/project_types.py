@@ -3,6 +3,7 @@
 
 from typing import Optional
 import datetime
+from functools import cached_property
 from os.path import join
 from pydantic import BaseModel, Field
 
@@ -33,6 +34,26 @@ class PaperMetadata(BaseModel):
             The local path where the PDF should be stored
         """
         return join(file_locations.pdfs_dir, self.paper_id + '.pdf')
+
+    @cached_property
+    def display_authors(self) -> str:
+        """The first two authors, followed by '...' if there are more. Computed
+        once per instance since it is shown wherever the paper is selected."""
+        return ', '.join(self.authors[:2]) + ('...' if len(self.authors) > 2 else '')
+
+    @cached_property
+    def display_authors_with_count(self) -> str:
+        """The first two authors, followed by how many more there are. Computed
+        once per instance since paper listings are redrawn for every search."""
+        authors = ', '.join(self.authors[:2])
+        if len(self.authors) > 2:
+            authors += f" + {len(self.authors) - 2} more"
+        return authors
+
+    @cached_property
+    def display_categories(self) -> str:
+        """The first two categories, followed by '...' if there are more."""
+        return ', '.join(self.categories[:2]) + ('...' if len(self.categories) > 2 else '')
     
 class SearchResult(BaseModel):
     """Results from a semantic search of the index."""
@@ -53,7 +53,7 @@ def insert_metadata(markdown:str,
     INVARIANT: Title Requirement for Summaries
     The markdown MUST include a title formatted as a level 1 header (starting with '#').
     If no title is found, this function raises SummarizationError.
-    This requirement is enforced in the prompt templates (see improve-summary-v1.md and improve-summary-v2.md).
+    This requirement is enforced in the prompt templates (see improve-summary-v1.md through improve-summary-v3.md).
     """
     found_title = False
     result = []
@@ -100,17 +100,19 @@ def summarize_paper(text: str, pmd: PaperMetadata, feedback: Optional[str] = Non
 
     print(f"Generating summary for text of {len(text)} characters...")
 
-    # Build the prompt based on whether we have feedback
+    # Build the prompt based on whether we have feedback. Both prompts start with
+    # the paper text, so a provider's prompt cache can reuse that prefix across
+    # the initial summary and every improvement of it.
     if feedback and previous_summary:
         # We're improving an existing summary
-        logger.debug(f"Using improve-summary-v2 prompt")
-        prompt = subst_prompt('improve-summary-v2', feedback=feedback,
+        logger.debug(f"Using improve-summary-v3 prompt")
+        prompt = subst_prompt('improve-summary-v3', feedback=feedback,
                               previous_summary=previous_summary,
                               text_block=text)
     else:
         # Use the original summarization prompt
-        logger.debug(f"Using base-summary-v2 prompt")
-        prompt = subst_prompt('base-summary-v2', text_block=text)
+        logger.debug(f"Using base-summary-v3 prompt")
+        prompt = subst_prompt('base-summary-v3', text_block=text)
 
     try:
         llm = get_default_model()
@@ -1,13 +1,16 @@
 import os
 import datetime
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from os.path import isdir, exists, join
 from shutil import rmtree
 from typing import Optional, List
 import numpy as np
 import chromadb
-from llama_index.core import SimpleDirectoryReader, VectorStoreIndex, StorageContext
-from llama_index.core.schema import Document, NodeWithScore
+from llama_index.core import Settings, SimpleDirectoryReader, VectorStoreIndex, StorageContext
+from llama_index.core.ingestion import run_transformations
+from llama_index.core.schema import BaseNode, Document, MetadataMode, NodeWithScore
 from llama_index.vector_stores.chroma import ChromaVectorStore
 import pymupdf4llm
 
@@ -26,6 +29,17 @@ logger = logging.getLogger(__name__)
 CONTENT_INDEX = None
 SUMMARY_INDEX = None
 
+# Incremented whenever the contents of either index change. Callers that cache
+# search answers (see ResearchAssistantWorkflow.get_cached_search_answer) include it in their cache keys, so
+# anything cached before a paper was added or removed is no longer matched.
+INDEX_GENERATION = 0
+
+
+def bump_index_generation() -> None:
+    """Mark cached search results as stale after an index change."""
+    global INDEX_GENERATION
+    INDEX_GENERATION += 1
+
 class IndexError(Exception):
     pass
 
@@ -237,7 +251,9 @@ def _initialize_chroma_vector_store(file_locations: FileLocations, index_type: s
     db_path = _get_chroma_db_path(file_locations, index_type)
     chroma_client = chromadb.PersistentClient(path=db_path)
     
-    # Get or create a collection based on index type
+    # Get or create a collection based on index type. Chroma indexes every
+    # collection with HNSW (ef_search=100 by default), so queries are already
+    # sublinear in the number of chunks and no separate ANN index is needed.
     collection_name = f"{index_type}_index"
     collection = chroma_client.get_or_create_collection(collection_name)
     
@@ -349,6 +365,36 @@ def _get_or_initialize_index(file_locations: FileLocations, index_type: str = "c
     return current_index
 
 
+def load_summary_index(file_locations: FileLocations = FILE_LOCATIONS) -> None:
+    """Load (or create) the summary index if it is not loaded yet.
+
+    Opening ChromaDB is the slow part of the first index_summary call and does
+    not depend on the summary file, so callers can run this while the summary
+    is still being written.
+    """
+    _get_or_initialize_index(file_locations, "summary")
+
+
+def warm_indexes(file_locations: FileLocations = FILE_LOCATIONS) -> None:
+    """Open the existing content and summary indexes so the first search does not pay for it.
+
+    The embedding model is a remote API client configured once in models.py, so the
+    one-time cost of a first search is opening the ChromaDB collections. Missing
+    indexes are left alone rather than created; searches report them as before.
+    """
+    global CONTENT_INDEX, SUMMARY_INDEX
+    if CONTENT_INDEX is None:
+        try:
+            CONTENT_INDEX = _load_existing_chroma_vector_store(file_locations, "content")
+        except Exception as e:
+            logger.debug(f"Not warming content index: {e}")
+    if SUMMARY_INDEX is None:
+        try:
+            SUMMARY_INDEX = _load_existing_chroma_vector_store(file_locations, "summary")
+        except Exception as e:
+            logger.debug(f"Not warming summary index: {e}")
+
+
 def _paper_already_indexed(paper_id: str, index: VectorStoreIndex) -> bool:
     """Check if a paper is already indexed by searching for documents with the paper_id.
     
@@ -388,17 +434,15 @@ def _paper_already_indexed(paper_id: str, index: VectorStoreIndex) -> bool:
         return False
 
 
-def _add_document_to_index(doc: Document, pmd: PaperMetadata, index: VectorStoreIndex, index_type: str = "content"):
-    """Add a document to the specified index with appropriate metadata.
+def _set_document_metadata(doc: Document, pmd: PaperMetadata, index_type: str = "content"):
+    """Fill in the metadata a document needs before it is added to an index.
     
     Parameters
     ----------
     doc : Document
-        The LlamaIndex document to add
+        The LlamaIndex document to update in place
     pmd : PaperMetadata
         The paper metadata for adding to document metadata
-    index : VectorStoreIndex
-        The index to add the document to
     index_type : str
         Either "content" or "summary" to determine appropriate metadata
     """
@@ -433,9 +477,55 @@ def _add_document_to_index(doc: Document, pmd: PaperMetadata, index: VectorStore
             doc.metadata['file_path'] = f'summaries/{pmd.paper_id}.md'
         elif source_type == 'notes':
             doc.metadata['file_path'] = f'notes/{pmd.paper_id}.md'
+
+
+def _embed_nodes_concurrently(nodes: List[BaseNode], embed_model) -> None:
+    """Set the embedding of each node, sending the batches of embed_batch_size
+    texts as up to EMBEDDING_CONCURRENCY concurrent requests. Nodes that fit in
+    a single batch are left for the index to embed with its one request.
+    """
+    batch_size = embed_model.embed_batch_size
+    if len(nodes) <= batch_size:
+        return
+    texts = [node.get_content(metadata_mode=MetadataMode.EMBED) for node in nodes]
+    batches = [texts[i:i + batch_size] for i in range(0, len(texts), batch_size)]
+    with ThreadPoolExecutor(max_workers=min(len(batches), constants.EMBEDDING_CONCURRENCY)) as pool:
+        embeddings = chain.from_iterable(pool.map(embed_model.get_text_embedding_batch, batches))
+        for node, embedding in zip(nodes, embeddings):
+            node.embedding = embedding
+
+
+def _add_documents_to_index(docs: List[Document], pmd: PaperMetadata, index: VectorStoreIndex, index_type: str = "content"):
+    """Add documents to the specified index with appropriate metadata.
+
+    All the documents are chunked together and inserted with a single
+    insert_nodes call, so their chunks are embedded in batches of
+    EMBEDDING_BATCH_SIZE rather than with one embedding request per document
+    (e.g. per PDF page). For long papers that need several batches, the
+    batches are embedded concurrently.
+    
+    Parameters
+    ----------
+    docs : List[Document]
+        The LlamaIndex documents to add
+    pmd : PaperMetadata
+        The paper metadata for adding to document metadata
+    index : VectorStoreIndex
+        The index to add the documents to
+    index_type : str
+        Either "content" or "summary" to determine appropriate metadata
+    """
+    for doc in docs:
+        _set_document_metadata(doc, pmd, index_type)
     
-    # Insert the document
-    index.insert(doc)
+    # Same steps as index.insert(doc), once for the whole batch. The indexes are
+    # created with the global Settings, so chunk and embed with those.
+    nodes = run_transformations(docs, Settings.transformations)
+    _embed_nodes_concurrently(nodes, Settings.embed_model)
+    index.insert_nodes(nodes)
+    for doc in docs:
+        index.docstore.set_document_hash(doc.id_, doc.hash)
+    bump_index_generation()
 
 
 def parse_file(pmd:PaperMetadata, file_locations:FileLocations=FILE_LOCATIONS) -> str:
@@ -536,8 +626,7 @@ def index_file_using_pymupdf_parser(pmd:PaperMetadata, file_locations:FileLocati
 
     # 4. Insert the new document into the content index.
     print(f"Adding new document '{local_pdf_path}' with {len(llama_docs)} chunks to the content index.")
-    for doc in llama_docs:
-        _add_document_to_index(doc, pmd, content_index, "content")
+    _add_documents_to_index(llama_docs, pmd, content_index, "content")
 
     # 5. ChromaDB automatically persists changes, no need to manually save
     print("Content index updated successfully (ChromaDB auto-persists).")
@@ -625,7 +714,7 @@ def index_summary(pmd: PaperMetadata, file_locations: FileLocations = FILE_LOCAT
     print(f"Adding summary for paper {pmd.paper_id} with {len(documents)} chunks to the summary index.")
     for doc in documents:
         doc.metadata['source_type'] = 'summary'
-        _add_document_to_index(doc, pmd, summary_index, "summary")
+    _add_documents_to_index(documents, pmd, summary_index, "summary")
     
     print("Summary index updated successfully (ChromaDB auto-persists).")
 
@@ -701,7 +790,7 @@ def index_notes(pmd: PaperMetadata, file_locations: FileLocations = FILE_LOCATIO
     print(f"Adding notes for paper {pmd.paper_id} with {len(documents)} chunks to the summary index.")
     for doc in documents:
         doc.metadata['source_type'] = 'notes'
-        _add_document_to_index(doc, pmd, summary_index, "summary")
+    _add_documents_to_index(documents, pmd, summary_index, "summary")
     
     print("Summary index updated successfully with notes (ChromaDB auto-persists).")
 
@@ -1166,6 +1255,7 @@ def rebuild_index(file_locations:FileLocations=FILE_LOCATIONS):
     # Reset the global indexes first to release any existing connections
     CONTENT_INDEX = None
     SUMMARY_INDEX = None
+    bump_index_generation()
 
     # Get list of papers first (before we mess with the database)
     paper_ids = get_downloaded_paper_ids(file_locations)
@@ -46,10 +46,18 @@ The workflow system is designed to work with multiple interface types:
 """
 
 from pydantic import Field
-from typing import List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional
 import os
+import re
+import time
+import asyncio
 import logging
+from collections import OrderedDict
+from functools import cache
+from itertools import chain
 from dataclasses import dataclass
+from datetime import datetime
+from operator import attrgetter
 
 logger = logging.getLogger(__name__)
 from llama_index.core.workflow import (
@@ -65,13 +73,288 @@ from llama_index.core.tools import FunctionTool
 
 from .file_locations import FileLocations, FILE_LOCATIONS
 from .arxiv_downloader import search_arxiv_papers, download_paper
-from .vector_store import index_file, search_index
+from . import arxiv_downloader
+from .vector_store import index_file, index_summary, search_index, load_summary_index
+from . import vector_store
 from .summarizer import summarize_paper, save_summary
+from . import paper_manager
+from .prompt import subst_prompt
 from .project_types import PaperMetadata, SearchResult
 from .interface_adapter import InterfaceAdapter
 from . import constants
 
 
+# Sort key for listing papers in paper ID order
+_BY_PAPER_ID = attrgetter('paper_id')
+
+# Static message bodies, built once at import rather than on every call
+_NO_PAPERS_CONTENT = """# Downloaded Papers
+
+📭 **No papers have been downloaded yet.**
+
+💡 **Get started by finding papers:**
+- Use `find <query>` to search ArXiv and download papers
+- Example: `find machine learning transformers`
+- Papers will be indexed automatically for semantic search"""
+
+_PAPER_LIST_NEXT_STEPS = """💡 **Next steps:**
+- Use `summary <number|id>` to view existing summaries
+- Use `open <number|id>` to view paper content
+- Use `sem-search <query>` to search across papers
+"""
+
+# Report templates for semantic search answers, filled in with str.format.
+# A report is a header, one entry per paper, then a footer.
+_SEARCH_SUMMARY_HEADER = "# Search Results Summary: {query}\n\n{summary}\n\n## References and Sources\n\n"
+
+_SEARCH_SUMMARY_PAPER = """### {title}
+- **Paper ID**: {paper_id}
+- **PDF File**: `{pdf_path}`
+- **Summary File**: {summary_file}
+- **{pages_label}**: {pages}
+
+"""
+
+_SEARCH_SUMMARY_FOOTER = """## Search Statistics
+- **Query**: {query}
+- **Results**: {num_results} relevant text chunks
+- **Papers**: {num_papers} unique papers
+- **Index Location**: `{index_dir}`
+"""
+
+_ANSWER_HEADER = "# Answer: {query}\n\n{answer}\n\n## Papers Used in This Answer\n\n"
+
+_ANSWER_PAPER = """{number}. **{title}**
+   - Paper ID: {paper_id}
+   - {pages_label}: {pages}
+   - PDF: `{pdf_path}`
+{summary_line}
+"""
+
+_ANSWER_SUMMARY_LINE = "   - Summary: `{summary_path}`\n"
+
+_ANSWER_FOOTER = "---\n\n*Search details: Found {num_results} relevant chunks across {num_papers} papers*"
+
+_RESEARCH_REFERENCES_HEADER = "\n\n## Detailed References\n\n"
+
+_RESEARCH_REFERENCE = """### {title}
+- **ArXiv ID**: {paper_id}
+- **{pages_label}**: {pages}
+- **PDF**: `{pdf_path}`
+- **Summary**: `{summary_path}`
+
+"""
+
+_RESEARCH_FOOTER = "---\n\n*Research details: Analyzed {num_papers} papers, synthesized {num_excerpts} detailed excerpts*\n"
+
+_PAPER_LIST_SUMMARY = """
+
+## Summary
+
+- **Total Papers**: {num_papers}
+- **Storage Location**: `{pdfs_dir}`
+- **Summaries Location**: `{summaries_dir}`
+- **Index Location**: `{index_dir}`
+
+"""
+
+_INSUFFICIENT_ANSWER_MESSAGE = """❌ **Insufficient information to answer the question**
+
+**Your Question:** {query}
+
+**Analysis:** The retrieved passages from {num_papers} paper(s) do not contain sufficient information to adequately answer your question.
+
+**What was found:** {num_results} relevant text chunks were retrieved, but they don't provide enough context or specific information to address your query.
+
+**Suggestions:**
+- Try rephrasing your question with different keywords
+- Search for more specific terms related to your question
+- Use the `find` command to download more papers on this topic
+- Consider breaking down complex questions into simpler parts"""
+
+_INSUFFICIENT_ANSWER_PAPERS_HEADER = "\n\n**Papers searched:**\n"
+
+_INSUFFICIENT_ANSWER_PAPER = "{number}. {title} (ID: {paper_id})\n"
+
+
+# Phrases the LLM uses when the retrieved passages cannot answer the question,
+# matched case-insensitively in a single pass over the answer
+_INSUFFICIENT_ANSWER_PATTERNS = [
+    "the retrieved passages do not contain sufficient information",
+    "cannot be answered based on",
+    "not enough information to answer",
+    "insufficient evidence to",
+    "passages do not provide enough information",
+    "cannot determine from the provided passages"
+]
+_INSUFFICIENT_ANSWER_RE = re.compile(
+    "|".join(re.escape(pattern) for pattern in _INSUFFICIENT_ANSWER_PATTERNS),
+    re.IGNORECASE
+)
+
+# Used to turn an LLM-generated title into a filename
+_TITLE_UNSAFE_CHARS_RE = re.compile(r'[^\w\s-]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+_SUMMARY_SAVED_MESSAGE = """🎉 **Summary Saved Successfully!**
+
+**Paper:** {title}
+**Summary Location:** {file_path}
+
+You can now find another paper or start a new search."""
+
+_PROCESS_COMPLETE_MESSAGE = """🎉 **Process Complete!**
+
+**Paper:** {title}
+**Actions Completed:**
+  • Downloaded PDF
+  • Indexed for search
+  • Generated summary
+  • Saved to filesystem
+  • Indexed summary for search
+
+**Summary Location:** {file_path}
+
+You can now find another paper or start a new search."""
+
+# Static parts of the LLM prompts. Only the query and retrieved context vary
+# per call, so the prompts are assembled by joining these around them. The
+# instructions come first so that every request shares the same leading text,
+# which LLM backends with prompt prefix caching can reuse across calls.
+_SEARCH_SUMMARY_PROMPT_PREFIX = """Based on the search results below for the query, provide a comprehensive summary that synthesizes the key insights and findings. Include relevant details and organize the information clearly.
+
+Please provide a well-structured summary that addresses the query and highlights the most relevant information from these papers.
+
+Query: """
+_SEARCH_SUMMARY_PROMPT_MID = """
+
+Search Results:
+"""
+
+_RAG_PREFIX = """You are a research assistant tasked with answering a specific question based on retrieved passages from academic papers.
+
+INSTRUCTIONS:
+1. Carefully analyze the retrieved passages to determine if they contain information relevant to answering the question
+2. If the passages contain relevant information, provide a comprehensive answer that:
+   - Directly addresses the question
+   - Synthesizes information from multiple sources when applicable
+   - Cites specific findings or claims from the papers
+   - Maintains scientific accuracy and nuance
+3. If the passages do NOT contain sufficient information to answer the question, clearly state this limitation
+4. Focus on answering the specific question rather than providing a general summary of the papers
+
+RESPONSE FORMAT:
+Provide your answer in a clear, well-structured format. Be specific about what the research shows and acknowledge any limitations in the available information.
+
+QUESTION: """
+_RAG_MID = """
+
+RETRIEVED PASSAGES:
+"""
+
+
+def _atomic_write_text(file_path: str, *parts: str) -> None:
+    """Write the text parts, in order, to file_path via a temporary file and
+    rename, so readers never see a partially written file. Taking the parts
+    separately avoids concatenating a large body just to prepend a header."""
+    tmp_path = file_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.writelines(parts)
+    os.replace(tmp_path, file_path)
+
+
+async def _complete_text(llm: LLM, prompt: str, on_chunk: Optional[Callable[[str], None]] = None) -> str:
+    """Run an LLM completion, streaming deltas to on_chunk when one is given.
+
+    Args:
+        llm: The LLM to complete with
+        prompt: The prompt to complete
+        on_chunk: Optional callback invoked with each text delta as it arrives
+
+    Returns:
+        The complete response text, stripped
+    """
+    if on_chunk is None:
+        response = await llm.acomplete(prompt)
+        return response.text.strip()
+
+    chunks = []
+    async for chunk in await llm.astream_complete(prompt):
+        if chunk.delta:
+            chunks.append(chunk.delta)
+            on_chunk(chunk.delta)
+    return "".join(chunks).strip()
+
+
+def _group_results_by_paper(results: List[SearchResult]) -> dict:
+    """Group search result chunks by paper in a single pass.
+
+    Returns a dict keyed by paper_id, in order of first appearance. Each value
+    holds the paper's title and file names, its chunks (text and page) and the
+    set of pages those chunks came from.
+
+    Result sets are capped by the search k (tens of chunks), so a plain dict
+    pass is cheaper than converting to columnar arrays for a vectorized groupby.
+    """
+    papers_dict = {}
+    for result in results:
+        paper_data = papers_dict.get(result.paper_id)
+        if paper_data is None:
+            paper_data = papers_dict[result.paper_id] = {
+                'title': result.paper_title,
+                'pdf_filename': result.pdf_filename,
+                'summary_filename': result.summary_filename,
+                'chunks': [],
+                'pages': set()
+            }
+        paper_data['chunks'].append({
+            'text': result.chunk,
+            'page': result.page
+        })
+        paper_data['pages'].add(result.page)
+    return papers_dict
+
+
+def _build_research_context(results: List[SearchResult]) -> tuple:
+    """Group detail chunks by paper and format them as the context of the research
+    synthesis prompt, touching each chunk once.
+
+    Returns (papers_context, context_text). papers_context is keyed by paper_id, in
+    order of first appearance, and holds each paper's title and the set of pages
+    its chunks came from; the chunk text itself only lives in context_text.
+    """
+    papers_context = {}
+    for result in results:
+        paper_data = papers_context.get(result.paper_id)
+        if paper_data is None:
+            paper_data = papers_context[result.paper_id] = {
+                'title': result.paper_title,
+                'pages': set(),
+                'excerpts': [f"\n### Paper: {result.paper_title} (ArXiv ID: {result.paper_id})\n\n"]
+            }
+        excerpts = paper_data['excerpts']
+        excerpts.append(f"**Excerpt {len(excerpts)}** (Page {result.page}):\n{result.chunk}\n\n")
+        paper_data['pages'].add(result.page)
+    context_text = "".join(part for paper_data in papers_context.values()
+                           for part in paper_data.pop('excerpts'))
+    return papers_context, context_text
+
+
+def _iter_context(papers_dict: dict) -> Iterator[str]:
+    """Yield the retrieved-passages section of a RAG prompt piece by piece for
+    grouped search results (see _group_results_by_paper), so the prompt can be
+    joined in one pass without first building the section as its own string."""
+    for paper_id, paper_data in papers_dict.items():
+        yield f"\n## Paper: {paper_data['title']} (ID: {paper_id})\n"
+        for chunk in paper_data['chunks']:
+            yield f"[Page {chunk['page']}] {chunk['text']}\n\n"
+
+
+def _format_pages(pages: set) -> str:
+    """Format a set of page numbers as a sorted, comma separated list."""
+    return ', '.join(map(str, sorted(pages)))
+
+
 # Define result classes for structured workflow returns
 @dataclass
 class QueryResult:
@@ -92,6 +375,22 @@ class ProcessingResult:
     message: str
 
 
+@dataclass
+class PaperProcessingResult:
+    """Result from processing a selected paper (download, index, summarize).
+    On failure, error holds the user-facing message and summary/paper_text are empty."""
+    paper: PaperMetadata
+    summary: str
+    paper_text: str
+    error: Optional[str] = None
+
+
+@dataclass
+class SummaryResult:
+    """Result from improving a summary with user feedback."""
+    summary: str
+
+
 @dataclass
 class SaveResult:
     """Result from a save operation."""
@@ -101,7 +400,27 @@ class SaveResult:
     message: str
 
 
+@cache
+def _get_tools() -> Dict[str, FunctionTool]:
+    """Function tools for the workflow. They only wrap module-level functions,
+    so they are built on first use and then shared by every workflow instance,
+    keeping the signature introspection out of module import."""
+    return {
+        "search_arxiv_papers": FunctionTool.from_defaults(fn=search_arxiv_papers),
+        "download_paper": FunctionTool.from_defaults(fn=download_paper),
+        "index_file": FunctionTool.from_defaults(fn=index_file),
+        "search_index": FunctionTool.from_defaults(fn=search_index),
+        "summarize_paper": FunctionTool.from_defaults(fn=summarize_paper),
+        "save_summary": FunctionTool.from_defaults(fn=save_summary),
+    }
+
+
 # Define custom events for the workflow
+class StatusEvent(Event):
+    """Progress message written to the event stream; unlike StopEvent, it does not end the run"""
+    message: str
+
+
 class SearchResultsEvent(Event):
     """Event containing ArXiv search results"""
     papers: List[PaperMetadata]
@@ -182,15 +501,110 @@ class ResearchAssistantWorkflow(Workflow):
         self.interface = interface
         self.file_locations = file_locations
         # Register tools with the workflow
-        self.tools = {
-            "search_arxiv_papers": FunctionTool.from_defaults(fn=search_arxiv_papers),
-            "download_paper": FunctionTool.from_defaults(fn=download_paper),
-            "index_file": FunctionTool.from_defaults(fn=index_file),
-            "search_index": FunctionTool.from_defaults(fn=search_index),
-            "summarize_paper": FunctionTool.from_defaults(fn=summarize_paper),
-            "save_summary": FunctionTool.from_defaults(fn=save_summary),
+        self.tools = _get_tools()
+        # Search answers keyed by (kind, index generation, normalized query), most
+        # recently used last; shared with WorkflowRunner
+        self.search_answer_cache: OrderedDict = OrderedDict()
+        # Recent ArXiv results keyed by (normalized query, k), most recently used last
+        self.arxiv_search_cache: OrderedDict = OrderedDict()
+        # Directories already created by this workflow, so later saves skip the stat/mkdir
+        self._ensured_dirs: set = set()
+        # Entry point for each workflow_type accepted by route_workflow
+        self._routes = {
+            'semantic_search': self.start_semantic_search_impl,
+            'add_paper': self.search_papers_impl,
         }
+
+    async def search_arxiv_cached(self, query: str, k: int) -> List[PaperMetadata]:
+        """Search ArXiv, reusing results for the same query (ignoring case and
+        whitespace differences) from the last few minutes. Failed and empty
+        searches are not cached. Returns a new list that the caller may reorder.
+        The search itself runs in a worker thread so it does not block the loop."""
+        key = (" ".join(query.lower().split()), k)
+        entry = self.arxiv_search_cache.get(key)
+        if entry is not None and time.monotonic() - entry[0] < constants.ARXIV_SEARCH_CACHE_TTL_SECONDS:
+            self.arxiv_search_cache.move_to_end(key)
+            return list(entry[1])
+        papers = await asyncio.to_thread(search_arxiv_papers, query, k=k)
+        now = time.monotonic()
+        if papers:
+            self.arxiv_search_cache[key] = (now, list(papers))
+            self.arxiv_search_cache.move_to_end(key)
+            if len(self.arxiv_search_cache) > constants.ARXIV_SEARCH_CACHE_MAX_ENTRIES:
+                self.arxiv_search_cache.popitem(last=False)
+        return papers
+
+    def _search_answer_key(self, kind: str, query: str) -> tuple:
+        """Cache key for a search answer of the given kind. Only the same query
+        (ignoring case and whitespace differences) against the same index
+        contents matches, so answers are not reused after papers are added."""
+        return (kind, vector_store.INDEX_GENERATION, " ".join(query.lower().split()))
+
+    def get_cached_search_answer(self, kind: str, query: str) -> Optional[Any]:
+        """Return the answer cached for query in the last few minutes, or None."""
+        key = self._search_answer_key(kind, query)
+        entry = self.search_answer_cache.get(key)
+        if entry is None or time.monotonic() - entry[0] >= constants.SEARCH_ANSWER_CACHE_TTL_SECONDS:
+            return None
+        self.search_answer_cache.move_to_end(key)
+        return entry[1]
+
+    def cache_search_answer(self, kind: str, query: str, answer: Any) -> None:
+        """Remember the answer to query, evicting the least recently used entry if full."""
+        key = self._search_answer_key(kind, query)
+        self.search_answer_cache[key] = (time.monotonic(), answer)
+        self.search_answer_cache.move_to_end(key)
+        if len(self.search_answer_cache) > constants.SEARCH_ANSWER_CACHE_MAX_ENTRIES:
+            self.search_answer_cache.popitem(last=False)
     
+    async def write_markdown_artifact(self, directory: str, ensure_dir: Callable[[], None],
+                                      filename: str, body: str, metadata: Optional[dict] = None,
+                                      overwrite: bool = True) -> str:
+        """Write a markdown file (summary, saved results) off the event loop.
+
+        Args:
+            directory: Directory to write into
+            ensure_dir: FileLocations method that creates directory; only called
+                the first time this workflow writes to it
+            filename: Name of the file within directory
+            body: Markdown content
+            metadata: Optional key/value pairs written as a YAML front matter header
+            overwrite: If False and filename already exists, write to the first free
+                name with a numeric suffix instead (e.g. ``name-2.md``)
+
+        Returns:
+            Path of the written file
+        """
+        if directory not in self._ensured_dirs:
+            ensure_dir()
+            self._ensured_dirs.add(directory)
+
+        if metadata:
+            header = "".join(f"{key}: {value}\n" for key, value in metadata.items())
+            parts = (f"---\n{header}---\n\n", body, "\n")
+        else:
+            parts = (body,)
+
+        file_path = os.path.join(directory, filename)
+        if not overwrite:
+            stem, ext = os.path.splitext(filename)
+            suffix = 2
+            while os.path.exists(file_path):
+                file_path = os.path.join(directory, f"{stem}-{suffix}{ext}")
+                suffix += 1
+        await asyncio.to_thread(_atomic_write_text, file_path, *parts)
+        return file_path
+
+    async def write_summary(self, paper_id: str, summary: str) -> str:
+        """Write a paper's summary to this workflow's summaries directory, where
+        index_summary reads it from. Returns the path of the written file."""
+        return await self.write_markdown_artifact(
+            self.file_locations.summaries_dir,
+            self.file_locations.ensure_summaries_dir,
+            paper_id + '.md',
+            summary
+        )
+
     # === WORKFLOW ROUTING ===
     
     @step
@@ -199,12 +613,14 @@ class ResearchAssistantWorkflow(Workflow):
         workflow_type = getattr(ev, 'workflow_type', 'add_paper')
         query = str(ev.query)
         
-        if workflow_type == 'semantic_search':
-            return SemanticSearchEvent(query=query)
-        elif workflow_type == 'add_paper':
-            return await self.search_papers_impl(ctx, query)
-        else:
+        route = self._routes.get(workflow_type)
+        if route is None:
             return StopEvent(result=f"❌ Unknown workflow type: {workflow_type}")
+        return await route(ctx, query)
+    
+    async def start_semantic_search_impl(self, ctx: Context, query: str) -> SemanticSearchEvent:
+        """Hand the query to the semantic search step"""
+        return SemanticSearchEvent(query=query)
     
     # === ADD PAPER WORKFLOW ===
     
@@ -214,7 +630,7 @@ class ResearchAssistantWorkflow(Workflow):
             with self.interface.progress_context(f"🔍 Searching for papers matching: '{query}'..."):
                 # Search for papers
                 try:
-                    papers = search_arxiv_papers(query, k=constants.ARXIV_SEARCH_RESULT_COUNT)
+                    papers = await self.search_arxiv_cached(query, constants.ARXIV_SEARCH_RESULT_COUNT)
                 except Exception as e:
                     # Immediately handle search API exceptions
                     self.interface.show_error(f"❌ Search failed: {str(e)}")
@@ -231,14 +647,14 @@ class ResearchAssistantWorkflow(Workflow):
             # To ensure numeric references map correctly, we now sort the PaperMetadata objects
             # themselves by paper_id ascending before display so the UI numbering matches the
             # internal state ordering.
-            papers.sort(key=lambda p: p.paper_id)
+            papers.sort(key=_BY_PAPER_ID)
             self.interface.display_papers(papers)
             
-            ctx.write_event_to_stream(
-                SearchResultsEvent(papers=papers, query=query)
-            )
+            # Build the event once: the streamed copy and the returned one are the same
+            results_event = SearchResultsEvent(papers=papers, query=query)
+            ctx.write_event_to_stream(results_event)
             
-            return SearchResultsEvent(papers=papers, query=query)
+            return results_event
         except Exception as e:
             self.interface.show_error(f"❌ Search failed: {str(e)}")
             return StopEvent(result=f"❌ Search failed: {str(e)}")
@@ -257,7 +673,7 @@ class ResearchAssistantWorkflow(Workflow):
             if len(ev.papers) == 1:
                 selected_paper = ev.papers[0]
                 self.interface.show_success(
-                    f"Selected paper: '{selected_paper.title}' by {', '.join(selected_paper.authors[:2])}{'...' if len(selected_paper.authors) > 2 else ''}"
+                    f"Selected paper: '{selected_paper.title}' by {selected_paper.display_authors}"
                 )
                 return PaperSelectedEvent(paper=selected_paper)
             else:
@@ -275,7 +691,7 @@ class ResearchAssistantWorkflow(Workflow):
         
         try:
             with self.interface.progress_context(f"📥 Downloading paper: '{paper.title}'..."):
-                local_path = download_paper(paper, self.file_locations)
+                local_path = await asyncio.to_thread(download_paper, paper, self.file_locations)
             
             self.interface.show_success(f"Paper downloaded successfully to: {local_path}")
             return PaperDownloadedEvent(paper=paper, local_path=local_path)
@@ -290,7 +706,9 @@ class ResearchAssistantWorkflow(Workflow):
         
         try:
             with self.interface.progress_context(f"🔍 Indexing paper: '{paper.title}'..."):
-                paper_text = index_file(paper)
+                # index_file reuses the PDF, index entry and extracted text
+                # cached under these locations from earlier sessions
+                paper_text = await asyncio.to_thread(index_file, paper, self.file_locations)
             
             self.interface.show_success(f"Paper indexed successfully. Extracted {len(paper_text)} characters of text.")
             return PaperIndexedEvent(paper=paper, paper_text=paper_text)
@@ -306,7 +724,7 @@ class ResearchAssistantWorkflow(Workflow):
         
         try:
             with self.interface.progress_context(f"📝 Generating summary for: '{paper.title}'..."):
-                summary = summarize_paper(paper_text, paper)
+                summary = await asyncio.to_thread(summarize_paper, paper_text, paper)
             
             self.interface.show_success("Summary generated successfully!")
             self.interface.render_content(summary, "markdown", "📝 Summary")
@@ -325,26 +743,18 @@ class ResearchAssistantWorkflow(Workflow):
 
         try:
             with self.interface.progress_context(f"💾 Saving summary for: '{paper.title}'..."):
-                file_path = save_summary(summary, paper.paper_id)
+                # Indexing reads the saved file, but opening the summary index
+                # does not, so that overlaps with the write
+                file_path, _ = await asyncio.gather(
+                    self.write_summary(paper.paper_id, summary),
+                    asyncio.to_thread(load_summary_index, self.file_locations),
+                )
 
             # Index the summary for semantic search
             with self.interface.progress_context(f"📚 Indexing summary for: '{paper.title}'..."):
-                from .vector_store import index_summary
-                index_summary(paper, self.file_locations)
+                await asyncio.to_thread(index_summary, paper, self.file_locations)
 
-            completion_message = f"""🎉 **Process Complete!**
-
-**Paper:** {paper.title}
-**Actions Completed:**
-  • Downloaded PDF
-  • Indexed for search
-  • Generated summary
-  • Saved to filesystem
-  • Indexed summary for search
-
-**Summary Location:** {file_path}
-
-You can now find another paper or start a new search."""
+            completion_message = _PROCESS_COMPLETE_MESSAGE.format(title=paper.title, file_path=file_path)
 
             self.interface.render_content(completion_message, "markdown", "✅ Success")
             return StopEvent(result=f"Summary saved successfully: {file_path}")
@@ -360,6 +770,11 @@ You can now find another paper or start a new search."""
         query = ev.query
         
         try:
+            cached_response = self.get_cached_search_answer("search-summary", query)
+            if cached_response is not None:
+                self.interface.show_success("Reusing the answer to this query")
+                return StopEvent(result=cached_response)
+
             with self.interface.progress_context(f"🔍 Searching local paper index for: '{query}'..."):
                 # Search the local index with enhanced retrieval for better compound query handling
                 results = search_index(
@@ -375,7 +790,7 @@ You can now find another paper or start a new search."""
                 self.interface.show_error(f"❌ No results found in local index for '{query}'. Try adding more papers or using different search terms.")
                 return StopEvent(result=f"❌ No results found for '{query}'")
             
-            self.interface.show_success(f"Found {len(results)} relevant chunks from {len(set(r.paper_id for r in results))} paper(s)")
+            self.interface.show_success(f"Found {len(results)} relevant chunks from {len({r.paper_id for r in results})} paper(s)")
             
             return SemanticSearchResultsEvent(results=results, query=query)
         except Exception as e:
@@ -389,73 +804,46 @@ You can now find another paper or start a new search."""
         query = ev.query
         
         ctx.write_event_to_stream(
-            StopEvent(result=f"📝 Generating summary of search results for: '{query}'...")
+            StatusEvent(message=f"📝 Generating summary of search results for: '{query}'...")
         )
         
         try:
             # Group results by paper
-            papers_dict = {}
-            for result in results:
-                if result.paper_id not in papers_dict:
-                    papers_dict[result.paper_id] = {
-                        'title': result.paper_title,
-                        'pdf_filename': result.pdf_filename,
-                        'summary_filename': result.summary_filename,
-                        'chunks': []
-                    }
-                papers_dict[result.paper_id]['chunks'].append({
-                    'text': result.chunk,
-                    'page': result.page
-                })
-            
-            # Create context for LLM summarization
-            context_text = ""
-            for paper_id, paper_data in papers_dict.items():
-                context_text += f"\n## Paper: {paper_data['title']} (ID: {paper_id})\n"
-                for chunk in paper_data['chunks']:
-                    context_text += f"[Page {chunk['page']}] {chunk['text']}\n\n"
+            papers_dict = _group_results_by_paper(results)
             
-            # Generate summary using LLM
-            summary_prompt = f"""Based on the following search results for the query "{query}", provide a comprehensive summary that synthesizes the key insights and findings. Include relevant details and organize the information clearly.
-
-Search Results:
-{context_text}
-
-Please provide a well-structured summary that addresses the query and highlights the most relevant information from these papers."""
+            # Generate summary using LLM, with the search results as context
+            summary_prompt = "".join(chain((_SEARCH_SUMMARY_PROMPT_PREFIX, query, _SEARCH_SUMMARY_PROMPT_MID),
+                                           _iter_context(papers_dict)))
             
-            summary_response = await self.llm.acomplete(summary_prompt)
-            summary_text = summary_response.text
+            with self.interface.stream_context("📝 Search Results Summary") as on_chunk:
+                summary_text = await _complete_text(self.llm, summary_prompt, on_chunk)
             
             # Create final response with references and links
-            final_response = f"# Search Results Summary: {query}\n\n"
-            final_response += f"{summary_text}\n\n"
-            
-            # Add references section
-            final_response += "## References and Sources\n\n"
+            pdfs_dir = self.file_locations.pdfs_dir
+            summaries_dir = self.file_locations.summaries_dir
+            parts = [_SEARCH_SUMMARY_HEADER.format(query=query, summary=summary_text)]
             for paper_id, paper_data in papers_dict.items():
-                final_response += f"### {paper_data['title']}\n"
-                final_response += f"- **Paper ID**: {paper_id}\n"
-                final_response += f"- **PDF File**: `{self.file_locations.pdfs_dir}/{paper_data['pdf_filename']}`\n"
                 if paper_data['summary_filename']:
-                    final_response += f"- **Summary File**: `{self.file_locations.summaries_dir}/{paper_data['summary_filename']}`\n"
-                else:
-                    final_response += f"- **Summary File**: Not available\n"
-                
-                # Show relevant pages
-                pages = sorted(set(chunk['page'] for chunk in paper_data['chunks']))
-                if len(pages) == 1:
-                    final_response += f"- **Relevant Page**: {pages[0]}\n"
+                    summary_file = f"`{summaries_dir}/{paper_data['summary_filename']}`"
                 else:
-                    final_response += f"- **Relevant Pages**: {', '.join(map(str, pages))}\n"
-                final_response += "\n"
-            
-            # Add search statistics
-            final_response += f"## Search Statistics\n"
-            final_response += f"- **Query**: {query}\n"
-            final_response += f"- **Results**: {len(results)} relevant text chunks\n"
-            final_response += f"- **Papers**: {len(papers_dict)} unique papers\n"
-            final_response += f"- **Index Location**: `{self.file_locations.index_dir}`\n"
-            
+                    summary_file = "Not available"
+                parts.append(_SEARCH_SUMMARY_PAPER.format(
+                    title=paper_data['title'],
+                    paper_id=paper_id,
+                    pdf_path=f"{pdfs_dir}/{paper_data['pdf_filename']}",
+                    summary_file=summary_file,
+                    pages_label="Relevant Page" if len(paper_data['pages']) == 1 else "Relevant Pages",
+                    pages=_format_pages(paper_data['pages'])
+                ))
+            parts.append(_SEARCH_SUMMARY_FOOTER.format(
+                query=query,
+                num_results=len(results),
+                num_papers=len(papers_dict),
+                index_dir=self.file_locations.index_dir
+            ))
+            final_response = "".join(parts)
+
+            self.cache_search_answer("search-summary", query, final_response)
             return StopEvent(result=final_response)
             
         except Exception as e:
@@ -491,6 +879,8 @@ class WorkflowRunner:
         self.workflow = ResearchAssistantWorkflow(llm=llm, interface=interface, file_locations=file_locations)
         self.interface = interface
         self.current_state = None
+        # Last rendered paper listing: ((pdfs_dir mtime, paper ids), sorted papers, content)
+        self._paper_list_cache: Optional[tuple] = None
     
     async def start_add_paper_workflow(self, query: str) -> QueryResult:
         """Start the add paper workflow with a search query"""
@@ -499,19 +889,25 @@ class WorkflowRunner:
 
         found_papers = None
         result_message = ""
+        # Collected and shown once the workflow finishes rather than printed
+        # from inside the event loop
+        result_messages = []
 
         async for event in handler.stream_events():
             # Capture papers when search results are found
             if isinstance(event, SearchResultsEvent):
                 found_papers = event.papers
                 logger.info(f"Found {len(found_papers)} papers from search")
-
-            if isinstance(event, StopEvent):
+            elif isinstance(event, StatusEvent):
+                self.interface.show_progress(event.message)
+            elif isinstance(event, StopEvent):
                 result_message = event.result
-                print(event.result)
+                result_messages.append(event.result)
 
         # Create structured result
         if found_papers:
+            if result_messages:
+                self.interface.show_info("\n".join(result_messages))
             paper_ids = [paper.paper_id for paper in found_papers]
             logger.info(f"Add paper workflow completed successfully: {len(found_papers)} papers")
             return QueryResult(
@@ -531,17 +927,30 @@ class WorkflowRunner:
                 content=None
             )
     
-    async def start_semantic_search_workflow(self, query: str) -> QueryResult:
-        """Start the enhanced semantic search workflow with RAG summarization"""
+    async def start_semantic_search_workflow(self, query: str,
+                                             on_chunk: Optional[Callable[[str], None]] = None) -> QueryResult:
+        """Start the enhanced semantic search workflow with RAG summarization.
+
+        Args:
+            query: The question to answer from the indexed papers
+            on_chunk: Optional callback receiving text deltas of the answer as the
+                LLM streams it, so the UI can render before the answer completes
+        """
         logger.info(f"Starting semantic search workflow with query: '{query[:100]}...'")
         try:
-            # Directly call the semantic search methods
-            from .vector_store import search_index
+            # Repeating a query against the same index gets the earlier answer
+            cached_result = self.workflow.get_cached_search_answer("sem-search", query)
+            if cached_result is not None:
+                logger.info(f"Semantic search cache hit for query: '{query[:100]}...'")
+                self.interface.show_success("Reusing the answer to this query")
+                if on_chunk is not None:
+                    on_chunk(cached_result.content)
+                return cached_result
 
-            print(f"🔍 Searching local paper index for: '{query}'...")
+            self.interface.show_info(f"Searching local paper index for: '{query}'...")
 
             # Search the local index with enhanced retrieval for better compound query handling
-            results = search_index(
+            results = vector_store.search_index(
                 query,
                 k=constants.CONTENT_SEARCH_K,
                 file_locations=self.workflow.file_locations,
@@ -573,93 +982,31 @@ I couldn't find any passages in the indexed papers that are relevant to your que
                     content=no_results_message
                 )
 
-            num_papers = len(set(r.paper_id for r in results))
-            logger.info(f"Semantic search found {len(results)} chunks from {num_papers} papers")
-            print(f"✅ Found {len(results)} relevant chunks from {num_papers} paper(s)")
-
             # Group results by paper
-            papers_dict = {}
-            for result in results:
-                if result.paper_id not in papers_dict:
-                    papers_dict[result.paper_id] = {
-                        'title': result.paper_title,
-                        'pdf_filename': result.pdf_filename,
-                        'summary_filename': result.summary_filename,
-                        'chunks': []
-                    }
-                papers_dict[result.paper_id]['chunks'].append({
-                    'text': result.chunk,
-                    'page': result.page
-                })
-
-            # Create context for LLM summarization
-            context_text = ""
-            for paper_id, paper_data in papers_dict.items():
-                context_text += f"\n## Paper: {paper_data['title']} (ID: {paper_id})\n"
-                for chunk in paper_data['chunks']:
-                    context_text += f"[Page {chunk['page']}] {chunk['text']}\n\n"
-
-            print(f"📝 Generating RAG summary for: '{query}'...")
+            papers_dict = _group_results_by_paper(results)
+            num_papers = len(papers_dict)
+            logger.info(f"Semantic search found {len(results)} chunks from {num_papers} papers")
+            self.interface.show_success(f"Found {len(results)} relevant chunks from {num_papers} paper(s)")
+            self.interface.show_info(f"Generating RAG summary for: '{query}'...")
 
             # Enhanced RAG prompt that focuses on answering the specific question
-            rag_prompt = f"""You are a research assistant tasked with answering a specific question based on retrieved passages from academic papers.
+            rag_prompt = "".join(chain((_RAG_PREFIX, query, _RAG_MID), _iter_context(papers_dict)))
 
-QUESTION: {query}
-
-RETRIEVED PASSAGES:
-{context_text}
-
-INSTRUCTIONS:
-1. Carefully analyze the retrieved passages to determine if they contain information relevant to answering the question
-2. If the passages contain relevant information, provide a comprehensive answer that:
-   - Directly addresses the question
-   - Synthesizes information from multiple sources when applicable
-   - Cites specific findings or claims from the papers
-   - Maintains scientific accuracy and nuance
-3. If the passages do NOT contain sufficient information to answer the question, clearly state this limitation
-4. Focus on answering the specific question rather than providing a general summary of the papers
-
-RESPONSE FORMAT:
-Provide your answer in a clear, well-structured format. Be specific about what the research shows and acknowledge any limitations in the available information."""
-
-            rag_response = await self.workflow.llm.acomplete(rag_prompt)
-            answer_text = rag_response.text
-
-            print(f"🤖 LLM Response preview: {answer_text[:200]}...")
+            answer_text = await _complete_text(self.workflow.llm, rag_prompt, on_chunk)
 
             # Check if the LLM indicated insufficient information (common patterns)
-            # Only trigger if the response explicitly starts with insufficient information
-            insufficient_patterns = [
-                "the retrieved passages do not contain sufficient information",
-                "cannot be answered based on",
-                "not enough information to answer",
-                "insufficient evidence to",
-                "passages do not provide enough information",
-                "cannot determine from the provided passages"
-            ]
-
-            answer_lower = answer_text.lower()
-            if any(pattern in answer_lower for pattern in insufficient_patterns):
+            if _INSUFFICIENT_ANSWER_RE.search(answer_text):
                 # Return a response indicating insufficient information
-                final_response = f"""❌ **Insufficient information to answer the question**
-
-**Your Question:** {query}
-
-**Analysis:** The retrieved passages from {len(papers_dict)} paper(s) do not contain sufficient information to adequately answer your question.
-
-**What was found:** {len(results)} relevant text chunks were retrieved, but they don't provide enough context or specific information to address your query.
-
-**Suggestions:**
-- Try rephrasing your question with different keywords
-- Search for more specific terms related to your question
-- Use the `find` command to download more papers on this topic
-- Consider breaking down complex questions into simpler parts"""
+                final_response = _INSUFFICIENT_ANSWER_MESSAGE.format(
+                    query=query, num_papers=len(papers_dict), num_results=len(results)
+                )
 
                 # Still include the paper list for reference
                 if papers_dict:
-                    final_response += f"\n\n**Papers searched:**\n"
-                    for i, (paper_id, paper_data) in enumerate(papers_dict.items(), 1):
-                        final_response += f"{i}. {paper_data['title']} (ID: {paper_id})\n"
+                    final_response += _INSUFFICIENT_ANSWER_PAPERS_HEADER + "".join(
+                        _INSUFFICIENT_ANSWER_PAPER.format(number=i, title=paper_data['title'], paper_id=paper_id)
+                        for i, (paper_id, paper_data) in enumerate(papers_dict.items(), 1)
+                    )
 
                 return QueryResult(
                     success=False,
@@ -670,49 +1017,42 @@ Provide your answer in a clear, well-structured format. Be specific about what t
                 )
 
             # Create final response with answer and numbered paper references
-            final_response = f"# Answer: {query}\n\n"
-            final_response += f"{answer_text}\n\n"
-
-            # Add numbered references section
-            final_response += "## Papers Used in This Answer\n\n"
+            pdfs_dir = self.workflow.file_locations.pdfs_dir
+            summaries_dir = self.workflow.file_locations.summaries_dir
+            parts = [_ANSWER_HEADER.format(query=query, answer=answer_text)]
             for i, (paper_id, paper_data) in enumerate(papers_dict.items(), 1):
-                final_response += f"{i}. **{paper_data['title']}**\n"
-                final_response += f"   - Paper ID: {paper_id}\n"
-
-                # Show relevant pages for this paper
-                pages = sorted(set(chunk['page'] for chunk in paper_data['chunks']))
-                if len(pages) == 1:
-                    final_response += f"   - Relevant page: {pages[0]}\n"
-                else:
-                    final_response += f"   - Relevant pages: {', '.join(map(str, pages))}\n"
-
-                # Add file paths
-                pdf_path = f"{self.workflow.file_locations.pdfs_dir}/{paper_data['pdf_filename']}"
-                final_response += f"   - PDF: `{pdf_path}`\n"
-
                 if paper_data['summary_filename']:
-                    summary_path = f"{self.workflow.file_locations.summaries_dir}/{paper_data['summary_filename']}"
-                    final_response += f"   - Summary: `{summary_path}`\n"
-
-                final_response += "\n"
-
-            # Add search metadata
-            final_response += f"---\n\n"
-            final_response += f"*Search details: Found {len(results)} relevant chunks across {len(papers_dict)} papers*"
+                    summary_line = _ANSWER_SUMMARY_LINE.format(
+                        summary_path=f"{summaries_dir}/{paper_data['summary_filename']}"
+                    )
+                else:
+                    summary_line = ""
+                parts.append(_ANSWER_PAPER.format(
+                    number=i,
+                    title=paper_data['title'],
+                    paper_id=paper_id,
+                    pages_label="Relevant page" if len(paper_data['pages']) == 1 else "Relevant pages",
+                    pages=_format_pages(paper_data['pages']),
+                    pdf_path=f"{pdfs_dir}/{paper_data['pdf_filename']}",
+                    summary_line=summary_line
+                ))
+            parts.append(_ANSWER_FOOTER.format(num_results=len(results), num_papers=len(papers_dict)))
+            final_response = "".join(parts)
 
             # Extract paper IDs from results
             paper_ids = list(papers_dict.keys())
 
             logger.info(f"Semantic search completed successfully: generated {len(final_response)} char response from {len(paper_ids)} papers")
-            print(f"✅ Semantic search summary generated ({len(final_response)} characters)")
 
-            return QueryResult(
+            result = QueryResult(
                 success=True,
                 papers=[],  # Could populate with actual paper metadata if needed
                 paper_ids=paper_ids,
                 message="Semantic search completed successfully",
                 content=final_response
             )
+            self.workflow.cache_search_answer("sem-search", query, result)
+            return result
 
         except Exception as e:
             logger.error(f"Semantic search workflow failed: {str(e)}", exc_info=True)
@@ -725,82 +1065,81 @@ Provide your answer in a clear, well-structured format. Be specific about what t
                 content=error_message
             )
     
-    async def process_paper_selection(self, selected_paper: PaperMetadata):
-        """Process a selected paper through the complete workflow"""
+    async def process_paper_selection(self, selected_paper: PaperMetadata) -> PaperProcessingResult:
+        """Process a selected paper through the complete workflow.
+
+        The download, indexing, summarization and save calls are blocking, so each
+        runs in a worker thread and other tasks keep running on the event loop.
+
+        Returns:
+            PaperProcessingResult; if any step fails (including LLM or API errors),
+            its error field holds the message instead of the exception propagating
+        """
         logger.info(f"Starting paper processing for: {selected_paper.paper_id}")
         try:
-            from .arxiv_downloader import download_paper
-            from .vector_store import index_file
-            from .summarizer import summarize_paper, save_summary
-            from .paper_manager import load_paper_summary
-
             # Step 1: Download the paper
             logger.info(f"Downloading paper: {selected_paper.paper_id}")
-            print(f"📥 Downloading paper: '{selected_paper.title}'...")
-            local_path = download_paper(selected_paper, self.workflow.file_locations)
+            self.interface.show_info(f"Downloading paper: '{selected_paper.title}'...")
+            local_path = await asyncio.to_thread(arxiv_downloader.download_paper, selected_paper, self.workflow.file_locations)
             logger.info(f"Paper downloaded successfully: {local_path}")
-            print(f"✅ Paper downloaded successfully to: {local_path}")
+            self.interface.show_success(f"Paper downloaded successfully to: {local_path}")
 
-            # Step 2: Index the paper
+            # Step 2: Index the paper. Looking up an existing summary does not depend
+            # on the index, so both run concurrently and share cancellation.
             logger.info(f"Indexing paper: {selected_paper.paper_id}")
-            print(f"🔍 Indexing paper: '{selected_paper.title}'...")
-            paper_text = index_file(selected_paper)
+            self.interface.show_info(f"Indexing paper: '{selected_paper.title}'...")
+            async with asyncio.TaskGroup() as tg:
+                index_task = tg.create_task(
+                    asyncio.to_thread(index_file, selected_paper, self.workflow.file_locations)
+                )
+                # Step 3: Check if summary already exists
+                summary_task = tg.create_task(
+                    asyncio.to_thread(paper_manager.load_paper_summary, selected_paper.paper_id, self.workflow.file_locations)
+                )
+            paper_text = index_task.result()
+            success, existing_summary = summary_task.result()
             logger.info(f"Paper indexed successfully: extracted {len(paper_text)} chars")
-            print(f"✅ Paper indexed successfully. Extracted {len(paper_text)} characters of text.")
-
-            # Step 3: Check if summary already exists
-            success, existing_summary = load_paper_summary(selected_paper.paper_id, self.workflow.file_locations)
+            self.interface.show_success(f"Paper indexed successfully. Extracted {len(paper_text)} characters of text.")
 
             if success:
                 # Summary already exists - return it
                 logger.info(f"Using existing summary for paper: {selected_paper.paper_id}")
-                print(f"📄 Summary already exists for: '{selected_paper.title}'")
-                print("✅ Using existing summary.")
+                self.interface.show_success(f"Summary already exists for: '{selected_paper.title}', using it.")
                 summary = existing_summary
             else:
                 # Generate new summary
                 logger.info(f"Generating summary for paper: {selected_paper.paper_id}")
-                print(f"📝 Generating summary for: '{selected_paper.title}'...")
-                summary = summarize_paper(paper_text, selected_paper)
+                self.interface.show_info(f"Generating summary for: '{selected_paper.title}'...")
+                summary = await asyncio.to_thread(summarize_paper, paper_text, selected_paper)
                 logger.info(f"Summary generated successfully for paper: {selected_paper.paper_id}")
-                print("✅ Summary generated successfully!")
+                self.interface.show_success("Summary generated successfully!")
 
                 # Save the summary
                 logger.info(f"Saving summary for paper: {selected_paper.paper_id}")
-                print(f"💾 Saving summary...")
-                save_summary(summary, selected_paper.paper_id)
+                self.interface.show_info("Saving summary...")
+                await self.workflow.write_summary(selected_paper.paper_id, summary)
                 logger.info(f"Summary saved successfully for paper: {selected_paper.paper_id}")
-                print("✅ Summary saved successfully!")
-
-            # Return an object with the expected attributes
-            class ProcessingResult:
-                def __init__(self, paper, summary, paper_text):
-                    self.paper = paper
-                    self.summary = summary
-                    self.paper_text = paper_text
+                self.interface.show_success("Summary saved successfully!")
 
             logger.info(f"Paper processing completed successfully: {selected_paper.paper_id}")
-            return ProcessingResult(selected_paper, summary, paper_text)
+            return PaperProcessingResult(selected_paper, summary, paper_text)
 
+        except ExceptionGroup as eg:
+            errors = "; ".join(str(e) for e in eg.exceptions)
+            logger.error(f"Paper processing failed for {selected_paper.paper_id}: {errors}", exc_info=True)
+            return PaperProcessingResult(selected_paper, "", "", error=f"❌ Paper processing failed: {errors}")
         except Exception as e:
             logger.error(f"Paper processing failed for {selected_paper.paper_id}: {str(e)}", exc_info=True)
-            return f"❌ Paper processing failed: {str(e)}"
+            return PaperProcessingResult(selected_paper, "", "", error=f"❌ Paper processing failed: {str(e)}")
 
-    async def improve_summary(self, paper: PaperMetadata, current_summary: str, paper_text: str, feedback: str):
+    async def improve_summary(self, paper: PaperMetadata, current_summary: str, paper_text: str, feedback: str) -> SummaryResult:
         """Improve a summary based on user feedback"""
         try:
-            from .summarizer import summarize_paper
-
-            print(f"🔄 Improving summary based on feedback: '{feedback}'...")
-            improved_summary = summarize_paper(paper_text, paper, feedback=feedback, previous_summary=current_summary)
-
-            print("✅ Summary improved!")
-
-            # Return an object with the summary attribute that chat.py expects
-            class SummaryResult:
-                def __init__(self, summary):
-                    self.summary = summary
+            self.interface.show_info(f"Improving summary based on feedback: '{feedback}'...")
+            improved_summary = await asyncio.to_thread(summarize_paper, paper_text, paper,
+                                                       feedback=feedback, previous_summary=current_summary)
 
+            self.interface.show_success("Summary improved!")
             return SummaryResult(improved_summary)
         except Exception as e:
             raise Exception(f"❌ Summary improvement failed: {str(e)}")
@@ -808,24 +1147,15 @@ Provide your answer in a clear, well-structured format. Be specific about what t
     async def save_summary(self, paper: PaperMetadata, summary: str, paper_text: str):
         """Save a summary to the filesystem"""
         try:
-            from .summarizer import save_summary
-            from .vector_store import index_summary
-
-            print(f"💾 Saving summary for: '{paper.title}'...")
-            file_path = save_summary(summary, paper.paper_id)
+            self.interface.show_info(f"Saving summary for: '{paper.title}'...")
+            file_path = await self.workflow.write_summary(paper.paper_id, summary)
 
             # Index the summary for semantic search
-            print(f"📚 Indexing summary for: '{paper.title}'...")
-            index_summary(paper, self.workflow.file_locations)
-
-            completion_message = f"""🎉 **Summary Saved Successfully!**
-
-**Paper:** {paper.title}
-**Summary Location:** {file_path}
+            self.interface.show_info(f"Indexing summary for: '{paper.title}'...")
+            await asyncio.to_thread(index_summary, paper, self.workflow.file_locations)
 
-You can now find another paper or start a new search."""
-
-            print(completion_message)
+            self.interface.render_content(_SUMMARY_SAVED_MESSAGE.format(title=paper.title, file_path=file_path),
+                                          "markdown", "✅ Success")
             return f"Summary saved successfully: {file_path}"
         except Exception as e:
             raise Exception(f"❌ Summary save failed: {str(e)}")
@@ -844,39 +1174,27 @@ The title should:
 
 Return only the title, nothing else."""
 
-            title_response = await self.workflow.llm.acomplete(title_prompt)
-            raw_title = title_response.text.strip()
+            raw_title = await _complete_text(self.workflow.llm, title_prompt)
 
             # Clean the title for filename use
-            import re
-            clean_title = re.sub(r'[^\w\s-]', '', raw_title)
-            clean_title = re.sub(r'\s+', '-', clean_title)
+            clean_title = _TITLE_UNSAFE_CHARS_RE.sub('', raw_title)
+            clean_title = _WHITESPACE_RE.sub('-', clean_title)
             clean_title = clean_title.lower()
 
-            # Create filename
-            filename = f"{clean_title}.md"
-            file_path = os.path.join(self.workflow.file_locations.results_dir, filename)
-
-            # Ensure results directory exists
-            self.workflow.file_locations.ensure_results_dir()
-
-            # Create content with metadata
-            from datetime import datetime
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-            full_content = f"""---
-title: {raw_title}
-query: {query}
-type: {content_type}
-created: {timestamp}
----
-
-{content}
-"""
-
-            # Write to file
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(full_content)
+            # Write the content with a metadata header
+            file_path = await self.workflow.write_markdown_artifact(
+                self.workflow.file_locations.results_dir,
+                self.workflow.file_locations.ensure_results_dir,
+                f"{clean_title}.md",
+                content,
+                metadata={
+                    "title": raw_title,
+                    "query": query,
+                    "type": content_type,
+                    "created": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                },
+                overwrite=False
+            )
 
             return SaveResult(
                 success=True,
@@ -893,7 +1211,8 @@ created: {timestamp}
                 message=f"Failed to save {content_type} results: {str(e)}"
             )
 
-    async def improve_content(self, current_content: str, feedback: str, content_type: str, original_query: str = "") -> ProcessingResult:
+    async def improve_content(self, current_content: str, feedback: str, content_type: str, original_query: str = "",
+                              on_chunk: Optional[Callable[[str], None]] = None) -> ProcessingResult:
         """Improve content (search results, research results) based on feedback.
 
         Args:
@@ -901,6 +1220,8 @@ created: {timestamp}
             feedback: User's feedback on what to improve
             content_type: Type of content ("semantic search" or "research")
             original_query: The original user query (optional, for context)
+            on_chunk: Optional callback receiving text deltas as the LLM streams
+                its response, so the UI can render before the response completes
 
         Returns:
             ProcessingResult with improved content
@@ -912,8 +1233,6 @@ created: {timestamp}
         Invalid content types trigger a fallback to generic improvement with a warning.
         """
         try:
-            from .prompt import subst_prompt
-
             # Select the appropriate prompt template based on content type
             if content_type == "semantic search":
                 template_name = "improve-search-v1"
@@ -922,6 +1241,9 @@ created: {timestamp}
             else:
                 # Fallback to generic improvement if content_type is unexpected
                 logger.warning(f"Unexpected content_type '{content_type}', using generic improvement")
+                template_name = None
+
+            if template_name is None:
                 improve_prompt = f"""Improve the following {content_type} based on the user's feedback.
 
 Current {content_type}:
@@ -930,26 +1252,16 @@ Current {content_type}:
 User feedback: "{feedback}"
 
 Please provide an improved version that addresses the feedback while maintaining the same format and structure."""
-                response = await self.workflow.llm.acomplete(improve_prompt)
-                improved_content = response.text.strip()
-
-                return ProcessingResult(
-                    success=True,
-                    paper=None,
-                    content=improved_content,
-                    message=f"{content_type.title()} improved successfully"
+            else:
+                # Load and substitute prompt template
+                improve_prompt = subst_prompt(
+                    template_name,
+                    query=original_query,
+                    feedback=feedback,
+                    current_content=current_content
                 )
 
-            # Load and substitute prompt template
-            improve_prompt = subst_prompt(
-                template_name,
-                query=original_query,
-                feedback=feedback,
-                current_content=current_content
-            )
-
-            response = await self.workflow.llm.acomplete(improve_prompt)
-            improved_content = response.text.strip()
+            improved_content = await _complete_text(self.workflow.llm, improve_prompt, on_chunk)
 
             return ProcessingResult(
                 success=True,
@@ -970,54 +1282,70 @@ Please provide an improved version that addresses the feedback while maintaining
     async def get_list_of_papers(self) -> QueryResult:
         """Get list of all downloaded papers."""
         try:
-            from .arxiv_downloader import get_downloaded_paper_ids, get_paper_metadata
-            from .paper_manager import format_paper_list
+            file_locations = self.workflow.file_locations
+            paper_ids = arxiv_downloader.get_downloaded_paper_ids(file_locations)
+
+            # Reuse the last listing while the downloaded papers are unchanged
+            try:
+                listing_key = (os.stat(file_locations.pdfs_dir).st_mtime_ns, tuple(sorted(paper_ids)))
+            except FileNotFoundError:
+                listing_key = None
+            if listing_key is not None and self._paper_list_cache is not None \
+                    and self._paper_list_cache[0] == listing_key:
+                _, papers, content = self._paper_list_cache
+                return QueryResult(
+                    success=True,
+                    papers=list(papers),
+                    paper_ids=[paper.paper_id for paper in papers],
+                    message=f"Found {len(papers)} downloaded papers",
+                    content=content
+                )
 
-            paper_ids = get_downloaded_paper_ids(self.workflow.file_locations)
-            papers = []
+            # Read all cached metadata in one pass; only papers missing from the
+            # cache need an individual (network) lookup
+            cached = await asyncio.to_thread(arxiv_downloader.load_cached_paper_metadata, paper_ids, file_locations)
+            papers = list(cached.values())
 
-            for paper_id in paper_ids:
-                try:
-                    paper_metadata = get_paper_metadata(paper_id)
-                    if paper_metadata:
-                        papers.append(paper_metadata)
-                except Exception:
-                    continue
+            # Look up the missing ones concurrently in worker threads, a few at a time
+            lookup_slots = asyncio.Semaphore(constants.ARXIV_METADATA_CONCURRENCY)
 
-            # Sort papers by paper ID ascending
-            papers.sort(key=lambda p: p.paper_id)
-
-            if not papers:
-                content = """# Downloaded Papers
+            async def lookup(paper_id: str) -> Optional[PaperMetadata]:
+                async with lookup_slots:
+                    return await asyncio.to_thread(arxiv_downloader.get_paper_metadata, paper_id)
 
-📭 **No papers have been downloaded yet.**
+            missing = [paper_id for paper_id in paper_ids if paper_id not in cached]
+            lookups = await asyncio.gather(*(lookup(paper_id) for paper_id in missing),
+                                           return_exceptions=True)
+            papers.extend(paper_metadata for paper_metadata in lookups
+                          if paper_metadata and not isinstance(paper_metadata, Exception))
 
-💡 **Get started by finding papers:**
-- Use `find <query>` to search ArXiv and download papers
-- Example: `find machine learning transformers`
-- Papers will be indexed automatically for semantic search"""
+            # Sort papers by paper ID ascending
+            papers.sort(key=_BY_PAPER_ID)
 
+            if not papers:
                 return QueryResult(
                     success=True,
                     papers=[],
                     paper_ids=[],
                     message="No papers downloaded yet",
-                    content=content
+                    content=_NO_PAPERS_CONTENT
                 )
 
-            # Format the papers list
-            content = format_paper_list(papers, "Downloaded Papers")
-
-            # Add summary information
-            content += f"\n\n## Summary\n\n"
-            content += f"- **Total Papers**: {len(papers)}\n"
-            content += f"- **Storage Location**: `{self.workflow.file_locations.pdfs_dir}`\n"
-            content += f"- **Summaries Location**: `{self.workflow.file_locations.summaries_dir}`\n"
-            content += f"- **Index Location**: `{self.workflow.file_locations.index_dir}`\n\n"
-            content += "💡 **Next steps:**\n"
-            content += "- Use `summary <number|id>` to view existing summaries\n"
-            content += "- Use `open <number|id>` to view paper content\n"
-            content += "- Use `sem-search <query>` to search across papers\n"
+            # Format the papers list, followed by summary information
+            content = "".join((
+                paper_manager.format_paper_list(papers, "Downloaded Papers"),
+                _PAPER_LIST_SUMMARY.format(
+                    num_papers=len(papers),
+                    pdfs_dir=file_locations.pdfs_dir,
+                    summaries_dir=file_locations.summaries_dir,
+                    index_dir=file_locations.index_dir
+                ),
+                _PAPER_LIST_NEXT_STEPS
+            ))
+
+            # Only a complete listing is reused; papers whose lookup failed are retried next time
+            if listing_key is not None and len(papers) == len(paper_ids):
+                self._paper_list_cache = (listing_key, tuple(papers), content)
 
             return QueryResult(
                 success=True,
@@ -1036,7 +1364,8 @@ Please provide an improved version that addresses the feedback while maintaining
                 content=f"❌ **Error listing papers**: {str(e)}"
             )
 
-    async def research_query(self, query: str, num_summary_papers: int = constants.RESEARCH_SUMMARY_PAPERS, num_detail_chunks: int = constants.RESEARCH_DETAIL_CHUNKS) -> QueryResult:
+    async def research_query(self, query: str, num_summary_papers: int = constants.RESEARCH_SUMMARY_PAPERS, num_detail_chunks: int = constants.RESEARCH_DETAIL_CHUNKS,
+                             on_chunk: Optional[Callable[[str], None]] = None) -> QueryResult:
         """
         Perform deep research query using two-stage approach.
 
@@ -1048,19 +1377,19 @@ Please provide an improved version that addresses the feedback while maintaining
             query: Research question to answer
             num_summary_papers: Number of papers to identify from summary search (default: from constants)
             num_detail_chunks: Number of detailed chunks to retrieve from papers (default: from constants)
+            on_chunk: Optional callback receiving text deltas of the synthesis as the
+                LLM streams it, so the UI can render before the answer completes
 
         Returns:
             QueryResult with synthesized research findings and paper references
         """
         try:
-            from .vector_store import search_summary_index, search_content_index_filtered
-            from .paper_manager import format_research_result, get_papers_by_ids
-
-            print(f"🔬 Starting research query: '{query}'...")
+            self.interface.show_info(f"Starting research query: '{query}'...")
 
             # Stage 1: Search summary index to identify relevant papers
-            print(f"📚 Stage 1: Searching summaries and notes to identify relevant papers...")
-            summary_results = search_summary_index(
+            self.interface.show_info("Stage 1: Searching summaries and notes to identify relevant papers...")
+            summary_results = await asyncio.to_thread(
+                vector_store.search_summary_index,
                 query,
                 k=num_summary_papers,
                 file_locations=self.workflow.file_locations,
@@ -1094,13 +1423,34 @@ Please provide an improved version that addresses the feedback while maintaining
                     content=no_results_message
                 )
 
-            # Extract unique paper IDs from summary results
-            paper_ids = list(set(result.paper_id for result in summary_results))
-            print(f"✅ Found {len(paper_ids)} relevant papers from summary search")
+            # Extract unique paper IDs from summary results, keeping their relevance order
+            paper_ids = list(dict.fromkeys(result.paper_id for result in summary_results))
+            self.interface.show_success(f"Found {len(paper_ids)} relevant papers from summary search")
+
+            # A single near-exact summary match answers the question with that
+            # paper's summary, skipping the detail search and LLM synthesis
+            if len(summary_results) == 1 and \
+                    summary_results[0].similarity_score > constants.RESEARCH_DIRECT_ANSWER_SIMILARITY:
+                has_summary, summary_text = await asyncio.to_thread(
+                    paper_manager.load_paper_summary, paper_ids[0], self.workflow.file_locations
+                )
+                if has_summary:
+                    logger.info(f"Research query answered directly from summary of {paper_ids[0]} "
+                                f"(similarity {summary_results[0].similarity_score:.3f})")
+                    self.interface.show_success(f"Exact summary match, using the summary of {paper_ids[0]}")
+                    papers = paper_manager.get_papers_by_ids(paper_ids, self.workflow.file_locations)
+                    return QueryResult(
+                        success=True,
+                        papers=papers,
+                        paper_ids=[paper.paper_id for paper in papers],
+                        message="Research query answered from paper summary",
+                        content=paper_manager.format_research_result(query, summary_text, papers)
+                    )
 
             # Stage 2: Search content index within identified papers for specific details
-            print(f"🔍 Stage 2: Searching detailed content within {len(paper_ids)} papers...")
-            detail_results = search_content_index_filtered(
+            self.interface.show_info(f"Stage 2: Searching detailed content within {len(paper_ids)} papers...")
+            detail_results = await asyncio.to_thread(
+                vector_store.search_content_index_filtered,
                 query,
                 paper_ids=paper_ids,
                 k=num_detail_chunks,
@@ -1110,38 +1460,18 @@ Please provide an improved version that addresses the feedback while maintaining
 
             if not detail_results:
                 # Fall back to summary results if no detail chunks found
-                print("⚠️  No detailed chunks found, using summary-level information...")
+                self.interface.show_info("No detailed chunks found, using summary-level information...")
                 detail_results = summary_results[:num_detail_chunks]
 
-            print(f"✅ Found {len(detail_results)} detailed chunks")
-
-            # Prepare context for synthesis
-            # Group chunks by paper for better organization
-            papers_context = {}
-            for result in detail_results:
-                if result.paper_id not in papers_context:
-                    papers_context[result.paper_id] = {
-                        'title': result.paper_title,
-                        'chunks': []
-                    }
-                papers_context[result.paper_id]['chunks'].append({
-                    'text': result.chunk,
-                    'page': result.page
-                })
-
-            # Format context for the synthesis prompt
-            context_text = ""
-            for paper_id, paper_data in papers_context.items():
-                context_text += f"\n### Paper: {paper_data['title']} (ArXiv ID: {paper_id})\n\n"
-                for i, chunk in enumerate(paper_data['chunks'], 1):
-                    context_text += f"**Excerpt {i}** (Page {chunk['page']}):\n{chunk['text']}\n\n"
+            self.interface.show_success(f"Found {len(detail_results)} detailed chunks")
+
+            # Prepare context for synthesis, with chunks grouped by paper
+            papers_context, context_text = _build_research_context(detail_results)
 
             # Stage 3: Synthesize findings using LLM
-            print(f"🤖 Stage 3: Synthesizing research findings...")
+            self.interface.show_info("Stage 3: Synthesizing research findings...")
 
             # Load the research synthesis prompt template and substitute variables
-            from .prompt import subst_prompt
-
             synthesis_prompt = subst_prompt(
                 "research_synthesis_v1",
                 query=query,
@@ -1149,42 +1479,31 @@ Please provide an improved version that addresses the feedback while maintaining
             )
 
             # Generate synthesis
-            synthesis_response = await self.workflow.llm.acomplete(synthesis_prompt)
-            synthesis_text = synthesis_response.text.strip()
+            synthesis_text = await _complete_text(self.workflow.llm, synthesis_prompt, on_chunk)
 
-            print(f"✅ Research synthesis generated")
+            self.interface.show_success("Research synthesis generated")
 
             # Load full paper metadata for the papers used
-            papers = get_papers_by_ids(list(papers_context.keys()), self.workflow.file_locations)
+            papers = paper_manager.get_papers_by_ids(list(papers_context.keys()), self.workflow.file_locations)
 
-            # Format the final research result
-            final_content = format_research_result(query, synthesis_text, papers)
-
-            # Add detailed references section with page numbers
-            final_content += "\n\n## Detailed References\n\n"
+            # Format the final research result, followed by detailed references
+            # with page numbers and the research statistics
+            pdfs_dir = self.workflow.file_locations.pdfs_dir
+            summaries_dir = self.workflow.file_locations.summaries_dir
+            parts = [paper_manager.format_research_result(query, synthesis_text, papers), _RESEARCH_REFERENCES_HEADER]
             for paper_id, paper_data in papers_context.items():
-                final_content += f"### {paper_data['title']}\n"
-                final_content += f"- **ArXiv ID**: {paper_id}\n"
-
-                # List all referenced pages
-                pages = sorted(set(chunk['page'] for chunk in paper_data['chunks']))
-                if len(pages) == 1:
-                    final_content += f"- **Referenced Page**: {pages[0]}\n"
-                else:
-                    final_content += f"- **Referenced Pages**: {', '.join(map(str, pages))}\n"
-
-                # Add file paths
-                pdf_path = f"{self.workflow.file_locations.pdfs_dir}/{paper_id}.pdf"
-                summary_path = f"{self.workflow.file_locations.summaries_dir}/{paper_id}.md"
-                final_content += f"- **PDF**: `{pdf_path}`\n"
-                final_content += f"- **Summary**: `{summary_path}`\n\n"
-
-            # Add research statistics
-            final_content += f"---\n\n"
-            final_content += f"*Research details: Analyzed {len(papers)} papers, "
-            final_content += f"synthesized {len(detail_results)} detailed excerpts*\n"
-
-            print(f"✅ Research query completed successfully")
+                parts.append(_RESEARCH_REFERENCE.format(
+                    title=paper_data['title'],
+                    paper_id=paper_id,
+                    pages_label="Referenced Page" if len(paper_data['pages']) == 1 else "Referenced Pages",
+                    pages=_format_pages(paper_data['pages']),
+                    pdf_path=f"{pdfs_dir}/{paper_id}.pdf",
+                    summary_path=f"{summaries_dir}/{paper_id}.md"
+                ))
+            parts.append(_RESEARCH_FOOTER.format(num_papers=len(papers), num_excerpts=len(detail_results)))
+            final_content = "".join(parts)
+
+            self.interface.show_success("Research query completed successfully")
 
             return QueryResult(
                 success=True,
@@ -1195,9 +1514,7 @@ Please provide an improved version that addresses the feedback while maintaining
             )
 
         except Exception as e:
-            import traceback
-            error_details = traceback.format_exc()
-            print(f"❌ Research query failed: {str(e)}\n{error_details}")
+            logger.error(f"Research query failed: {str(e)}", exc_info=True)
 
             error_message = f"""❌ **Research query failed**
 
@@ -1,5 +1,51 @@
-# pytest configuration to ensure 'my_research_assistant' is importable
+# pytest configuration: make 'my_research_assistant' importable, gate network tests behind --integration
+# and provide a local embedding model for tests that index papers
 import sys
 import os
+import hashlib
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+import numpy as np
+import pytest
+from llama_index.core.embeddings import BaseEmbedding
+
+
+def pytest_addoption(parser):
+    parser.addoption("--integration", action="store_true", default=False,
+                     help="also run tests marked 'integration', which need network access to ArXiv or the embedding API")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--integration"):
+        return
+    skip_integration = pytest.mark.skip(reason="needs --integration")
+    for item in items:
+        if "integration" in item.keywords:
+            item.add_marker(skip_integration)
+
+
+class FakeEmbedding(BaseEmbedding):
+    """Deterministic local embedding: the SHA-256 of the text, repeated to 64
+    bytes and L2-normalized. Equal texts get equal vectors and different texts
+    get different ones, without calling an embedding API."""
+
+    def _embed(self, text: str) -> list:
+        vec = np.frombuffer(hashlib.sha256(text.encode('utf-8')).digest() * 2, dtype=np.uint8).astype(np.float32)
+        return (vec / np.linalg.norm(vec)).tolist()
+
+    def _get_query_embedding(self, query: str) -> list:
+        return self._embed(query)
+
+    def _get_text_embedding(self, text: str) -> list:
+        return self._embed(text)
+
+    async def _aget_query_embedding(self, query: str) -> list:
+        return self._embed(query)
+
+
+@pytest.fixture(scope="session")
+def fake_embed_model():
+    """A FakeEmbedding for tests to install as Settings.embed_model when they
+    check indexing and search plumbing rather than retrieval quality."""
+    return FakeEmbedding()
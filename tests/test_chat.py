@@ -2,63 +2,152 @@
 
 import pytest
 import asyncio
-import tempfile
+import os
+import shutil
+from uuid import uuid4
 from unittest.mock import Mock, patch, AsyncMock
 from datetime import datetime
+from pathlib import Path
+
+from llama_index.core import Settings
 
 # Configure pytest-asyncio
 pytest_plugins = ('pytest_asyncio',)
 
 from my_research_assistant.chat import ChatInterface
 from my_research_assistant.file_locations import FileLocations
+from my_research_assistant.project_types import PaperMetadata
 from my_research_assistant import file_locations
+from my_research_assistant import vector_store as vs
+from my_research_assistant.arxiv_downloader import get_paper_metadata, download_paper
+
+
+@pytest.fixture(scope="session")
+def chat_test_dir(tmp_path_factory):
+    """One base temporary directory for the session; each test gets its own
+    subdirectory under it rather than a fresh TemporaryDirectory."""
+    return tmp_path_factory.mktemp("chat_tests")
 
 
 @pytest.fixture
-def temp_file_locations():
-    """Create a temporary directory and set FILE_LOCATIONS to use it.
-    After the test, restore the original FILE_LOCATIONS.
+def temp_file_locations(chat_test_dir, fake_embed_model, monkeypatch):
+    """Create a temporary directory and set FILE_LOCATIONS to use it, with
+    fresh indexes and a FakeEmbedding as the embedding model. monkeypatch
+    restores the originals after the test.
     """
-    # Save the original FILE_LOCATIONS
-    original_file_locations = file_locations.FILE_LOCATIONS
-    
-    # Also save and reset the global indexes to avoid test pollution
-    import my_research_assistant.vector_store as vs
-    original_content_index = vs.CONTENT_INDEX
-    original_summary_index = vs.SUMMARY_INDEX
-    original_vs_file_locations = vs.FILE_LOCATIONS
-    
-    # Create a temporary directory
-    with tempfile.TemporaryDirectory() as temp_dir:
-        # Create new FileLocations pointing to the temp directory
-        temp_locations = file_locations.FileLocations.get_locations(temp_dir)
-        
-        # Replace the module-level FILE_LOCATIONS
-        file_locations.FILE_LOCATIONS = temp_locations
-        
-        # Reset the global indexes to None so they get reinitialized
-        vs.CONTENT_INDEX = None
-        vs.SUMMARY_INDEX = None
-        
-        try:
-            yield temp_locations
-        finally:
-            # Restore the original FILE_LOCATIONS and indexes
-            file_locations.FILE_LOCATIONS = original_file_locations
-            vs.CONTENT_INDEX = original_content_index
-            vs.SUMMARY_INDEX = original_summary_index
-            vs.FILE_LOCATIONS = original_vs_file_locations
+    # Create a directory for this test under the session's base directory
+    temp_dir = chat_test_dir / f"t{uuid4().hex}"
+    temp_dir.mkdir()
+    temp_locations = file_locations.FileLocations.get_locations(str(temp_dir))
+
+    monkeypatch.setattr(file_locations, 'FILE_LOCATIONS', temp_locations)
+    monkeypatch.setattr(vs, 'FILE_LOCATIONS', temp_locations)
+    # Reset the global indexes to None so they get reinitialized
+    monkeypatch.setattr(vs, 'CONTENT_INDEX', None)
+    monkeypatch.setattr(vs, 'SUMMARY_INDEX', None)
+    # Index and search locally instead of calling the embedding API
+    monkeypatch.setattr(Settings, 'embed_model', fake_embed_model)
+    return temp_locations
+
+
+@pytest.fixture(scope="session")
+def paper_cache(tmp_path_factory):
+    """Locations shared by every test in the session for downloaded papers, so
+    each ArXiv paper's metadata and PDF are fetched at most once per run. Tests
+    copy papers from here into their own temp_file_locations with
+    fetch_test_paper(), which keeps the per-test indexes isolated.
+    """
+    return FileLocations.get_locations(str(tmp_path_factory.mktemp("paper_cache")))
+
+
+def fetch_test_paper(paper_id, paper_cache, target_locations):
+    """Download a paper into the session cache on first use, then copy its
+    metadata and PDF into the test's own file locations.
+    """
+    md = get_paper_metadata(paper_id, paper_cache)
+    cached_pdf = download_paper(md, paper_cache)
+    target_locations.ensure_paper_metadata_dir()
+    shutil.copy(f"{paper_cache.paper_metadata_dir}/{paper_id}.json", target_locations.paper_metadata_dir)
+    target_locations.ensure_pdfs_dir()
+    # Tests only read the PDF, so a hard link is enough; copy if the cache is
+    # on a different filesystem
+    target_pdf = md.get_local_pdf_path(target_locations)
+    try:
+        os.link(cached_pdf, target_pdf)
+    except OSError:
+        shutil.copy(cached_pdf, target_pdf)
+    return md
+
+
+def create_test_pdf(target_locations, paper_id: str) -> str:
+    """Write a minimal one-page PDF for the paper into the test's pdfs_dir."""
+    target_locations.ensure_pdfs_dir()
+    pdf_path = os.path.join(target_locations.pdfs_dir, f"{paper_id}.pdf")
+    with open(pdf_path, 'wb') as f:
+        f.write(b'%PDF-1.4\n')
+        f.write(b'1 0 obj\n<< /Type /Catalog /Pages 2 0 R >>\nendobj\n')
+        f.write(b'2 0 obj\n<< /Type /Pages /Kids [3 0 R] /Count 1 >>\nendobj\n')
+        f.write(b'3 0 obj\n<< /Type /Page /Parent 2 0 R /Contents 4 0 R >>\nendobj\n')
+        f.write(b'4 0 obj\n<< /Length 56 >>\nstream\nBT /F1 12 Tf 100 100 Td (Agent safety and shielding) Tj ET\nendstream\nendobj\n')
+        f.write(b'xref\n0 5\n')
+        f.write(b'trailer\n<< /Size 5 /Root 1 0 R >>\nstartxref\n0\n%%EOF\n')
+    return pdf_path
+
+
+@pytest.fixture
+def indexed_paper(temp_file_locations):
+    """Index a one-page local paper into the test's own locations, with
+    metadata written to the metadata cache so nothing is fetched from ArXiv.
+    """
+    md = PaperMetadata(
+        paper_id='2503.22738',
+        title="Agent Safety and Shielding",
+        published=datetime(2025, 3, 28),
+        updated=None,
+        paper_abs_url="http://arxiv.org/abs/2503.22738",
+        paper_pdf_url="http://arxiv.org/pdf/2503.22738",
+        authors=["Test Author"],
+        categories=["cs.AI"],
+        abstract="Shielding agents from unsafe actions.",
+        doi=None,
+        journal_ref=None
+    )
+    temp_file_locations.ensure_paper_metadata_dir()
+    with open(os.path.join(temp_file_locations.paper_metadata_dir, f"{md.paper_id}.json"), 'w') as f:
+        f.write(md.model_dump_json())
+    create_test_pdf(temp_file_locations, md.paper_id)
+    vs.index_file(md, temp_file_locations)
+    return md
 
 
 @pytest.fixture
-def mock_llm():
-    """Create a mock LLM for testing."""
-    llm = Mock()
-    # Mock the acomplete method to return a mock response
-    mock_response = Mock()
-    mock_response.text = "Test summary of search results"
-    llm.acomplete = AsyncMock(return_value=mock_response)
-    return llm
+def mock_get_model(monkeypatch):
+    """Patch the chat's get_default_model; tests set the LLM it returns (or
+    the error it raises) through return_value or side_effect."""
+    mock = Mock()
+    monkeypatch.setattr('my_research_assistant.chat.get_default_model', mock)
+    return mock
+
+
+@pytest.fixture(scope="session")
+def mock_llm_factory():
+    """Factory for mock LLMs whose acomplete returns a response with the given
+    text, and whose astream_complete streams it as a single chunk, or which
+    raise side_effect if one is given. Each call builds a new mock, so call
+    assertions stay per test.
+    """
+    def make(text="Test summary of search results", side_effect=None):
+        llm = Mock()
+        if side_effect is not None:
+            llm.acomplete = AsyncMock(side_effect=side_effect)
+            llm.astream_complete = AsyncMock(side_effect=side_effect)
+        else:
+            async def stream():
+                yield Mock(delta=text)
+            llm.acomplete = AsyncMock(return_value=Mock(text=text))
+            llm.astream_complete = AsyncMock(side_effect=lambda prompt: stream())
+        return llm
+    return make
 
 
 class TestChatInterface:
@@ -76,7 +165,6 @@ class TestChatInterface:
         assert chat.state_machine is not None
         assert chat.state_machine.current_state.value == "initial"
     
-    @patch('my_research_assistant.chat.get_default_model')
     def test_chat_interface_initialize_success(self, mock_get_model, temp_file_locations):
         """Test successful ChatInterface initialization."""
         # Mock the LLM
@@ -90,7 +178,6 @@ class TestChatInterface:
         assert chat.llm == mock_llm
         assert chat.workflow_runner is not None
     
-    @patch('my_research_assistant.chat.get_default_model')
     def test_chat_interface_initialize_failure(self, mock_get_model, temp_file_locations):
         """Test ChatInterface initialization failure."""
         # Mock get_default_model to raise an exception
@@ -103,8 +190,10 @@ class TestChatInterface:
         assert chat.llm is None
         assert chat.workflow_runner is None
     
-    def test_add_to_history(self):
+    @patch('my_research_assistant.chat.datetime')
+    def test_add_to_history(self, mock_datetime):
         """Test adding messages to conversation history."""
+        mock_datetime.now.return_value = datetime(2024, 1, 1, 9, 30, 15)
         chat = ChatInterface()
         
         chat.add_to_history("user", "test message")
@@ -112,7 +201,7 @@ class TestChatInterface:
         assert len(chat.conversation_history) == 1
         assert chat.conversation_history[0]['role'] == "user"
         assert chat.conversation_history[0]['content'] == "test message"
-        assert 'timestamp' in chat.conversation_history[0]
+        assert chat.conversation_history[0]['timestamp'] == "09:30:15"
     
     def test_clear_history(self):
         """Test clearing conversation history."""
@@ -134,27 +223,11 @@ class TestChatSemanticSearch:
     """Test semantic search functionality in ChatInterface."""
     
     @pytest.mark.asyncio
-    @patch('my_research_assistant.chat.get_default_model')
-    async def test_semantic_search_command_success(self, mock_get_model, temp_file_locations):
+    async def test_semantic_search_command_success(self, mock_get_model, temp_file_locations, indexed_paper,
+                                                   mock_llm_factory):
         """Test successful semantic search command execution."""
-        # Set up indexed papers for testing
-        from my_research_assistant.arxiv_downloader import get_paper_metadata, download_paper
-        import my_research_assistant.vector_store as vs
-        
-        # Override the imported FILE_LOCATIONS in vector_store
-        vs.FILE_LOCATIONS = temp_file_locations
-        
-        # Download and index a paper for testing
-        paper_id = '2503.22738'
-        md = get_paper_metadata(paper_id)
-        download_paper(md, temp_file_locations)
-        vs.index_file(md, temp_file_locations)
-        
         # Mock the LLM
-        mock_llm = Mock()
-        mock_response = Mock()
-        mock_response.text = "Test summary of search results from the semantic search"
-        mock_llm.acomplete = AsyncMock(return_value=mock_response)
+        mock_llm = mock_llm_factory("Test summary of search results from the semantic search")
         mock_get_model.return_value = mock_llm
         
         # Initialize chat interface
@@ -180,11 +253,10 @@ class TestChatSemanticSearch:
         assert len(chat.conversation_history) == 1
         assert chat.conversation_history[0]['role'] == "assistant"
         
-        # Verify LLM was called
-        mock_llm.acomplete.assert_called_once()
+        # Verify LLM was called; the chat streams the answer as it arrives
+        mock_llm.astream_complete.assert_called_once()
         
     @pytest.mark.asyncio
-    @patch('my_research_assistant.chat.get_default_model')
     async def test_semantic_search_command_no_results(self, mock_get_model, temp_file_locations):
         """Test semantic search command when no results are found."""
         # Mock the LLM
@@ -206,12 +278,10 @@ class TestChatSemanticSearch:
         assert chat.current_state == "ready"
     
     @pytest.mark.asyncio
-    @patch('my_research_assistant.chat.get_default_model')
-    async def test_semantic_search_command_error_handling(self, mock_get_model, temp_file_locations):
+    async def test_semantic_search_command_error_handling(self, mock_get_model, temp_file_locations, mock_llm_factory):
         """Test semantic search command error handling."""
         # Mock the LLM to raise an exception
-        mock_llm = Mock()
-        mock_llm.acomplete = AsyncMock(side_effect=Exception("LLM error"))
+        mock_llm = mock_llm_factory(side_effect=Exception("LLM error"))
         mock_get_model.return_value = mock_llm
         
         # Initialize chat interface
@@ -229,66 +299,44 @@ class TestChatSemanticSearch:
         assert chat.current_state == "ready"
 
 
+def setup_no_papers(temp_file_locations, paper_cache):
+    """No papers have been downloaded."""
+
+
+def setup_with_papers(temp_file_locations, paper_cache):
+    """Two downloaded papers, skipping the test if none can be fetched."""
+    papers = []
+    for paper_id in ['2503.22738', '1706.03762']:
+        try:
+            papers.append(fetch_test_paper(paper_id, paper_cache, temp_file_locations))
+        except Exception:
+            # Skip if paper can't be downloaded (e.g., network issues)
+            pass
+    if not papers:
+        pytest.skip("Could not download test papers")
+
+
+def setup_corrupted(temp_file_locations, paper_cache):
+    """A fake PDF file without metadata, so metadata loading fails."""
+    temp_file_locations.ensure_pdfs_dir()
+    Path(temp_file_locations.pdfs_dir, "fake_paper.pdf").write_bytes(b"fake content")
+
+
 class TestChatListCommand:
     """Test list command functionality in ChatInterface."""
     
     @pytest.mark.asyncio
-    async def test_list_command_no_papers(self, temp_file_locations):
-        """Test list command when no papers have been downloaded."""
-        chat = ChatInterface()
-        
-        # Execute list command with no papers
-        await chat.process_list_command()
-        
-        # Should handle gracefully without errors
-        assert True  # Test passes if no exceptions are raised
-    
-    @pytest.mark.asyncio
-    async def test_list_command_with_papers(self, temp_file_locations):
-        """Test list command with downloaded papers."""
-        # Download some papers for testing
-        from my_research_assistant.arxiv_downloader import get_paper_metadata, download_paper
-        
-        # Download two test papers
-        paper_ids = ['2503.22738', '1706.03762']  # Test papers
-        papers = []
-        
-        for paper_id in paper_ids:
-            try:
-                md = get_paper_metadata(paper_id)
-                download_paper(md, temp_file_locations)
-                papers.append(md)
-            except Exception:
-                # Skip if paper can't be downloaded (e.g., network issues)
-                pass
-        
-        if not papers:
-            pytest.skip("Could not download test papers")
-        
-        chat = ChatInterface()
-        
-        # Execute list command
-        await chat.process_list_command()
-        
-        # Should complete without errors
-        assert True  # Test passes if no exceptions are raised
-    
-    @pytest.mark.asyncio
-    async def test_list_command_error_handling(self, temp_file_locations):
-        """Test list command error handling for corrupted metadata."""
-        # Create a fake PDF file without proper metadata
-        import os
-        pdfs_dir = temp_file_locations.pdfs_dir
-        os.makedirs(pdfs_dir, exist_ok=True)
-        
-        # Create a fake PDF file that will cause metadata loading to fail
-        fake_pdf_path = os.path.join(pdfs_dir, "fake_paper.pdf")
-        with open(fake_pdf_path, "w") as f:
-            f.write("fake content")
-        
+    @pytest.mark.parametrize("setup", [
+        pytest.param(setup_no_papers, id="no_papers"),
+        pytest.param(setup_with_papers, id="with_papers", marks=pytest.mark.integration),
+        pytest.param(setup_corrupted, id="corrupted"),
+    ])
+    async def test_list_command(self, setup, temp_file_locations, paper_cache):
+        """Test that the list command handles each state of the papers directory."""
+        setup(temp_file_locations, paper_cache)
         chat = ChatInterface()
         
-        # Execute list command - should handle errors gracefully
+        # Execute list command - should handle each case gracefully
         await chat.process_list_command()
         
         # Should complete without crashing
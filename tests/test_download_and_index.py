@@ -1,53 +1,84 @@
 
 import os
-import tempfile
+import shutil
 import pytest
 from os.path import exists
+from llama_index.core import Settings
 from my_research_assistant import file_locations
+import my_research_assistant.vector_store as vs
 
 EXAMPLE_PAPER_ID='2503.22738'
 
 
 @pytest.fixture
-def temp_file_locations():
-    """Create a temporary directory and set FILE_LOCATIONS to use it.
-    After the test, restore the original FILE_LOCATIONS.
+def temp_file_locations(tmp_path_factory, fake_embed_model, monkeypatch):
+    """Create a temporary directory and set FILE_LOCATIONS to use it, with
+    fresh indexes and a FakeEmbedding as the embedding model. monkeypatch
+    restores the originals after the test. The directory is left to pytest,
+    which keeps the last few sessions' temp directories and removes older ones.
     """
-    # Save the original FILE_LOCATIONS
-    original_file_locations = file_locations.FILE_LOCATIONS
-    
-    # Also save and reset the global indexes to avoid test pollution
-    import my_research_assistant.vector_store as vs
-    original_content_index = vs.CONTENT_INDEX
-    original_summary_index = vs.SUMMARY_INDEX
-    original_vs_file_locations = vs.FILE_LOCATIONS
-    
-    # Create a temporary directory
-    with tempfile.TemporaryDirectory() as temp_dir:
-        # Create required prompts directory in temp directory
-        prompts_dir = os.path.join(temp_dir, 'prompts')
-        os.makedirs(prompts_dir, exist_ok=True)
-        
-        # Create new FileLocations pointing to the temp directory
-        temp_locations = file_locations.FileLocations.get_locations(temp_dir)
-        
-        # Replace the module-level FILE_LOCATIONS
-        file_locations.FILE_LOCATIONS = temp_locations
-        
-        # Reset the global indexes to None so they get reinitialized
-        vs.CONTENT_INDEX = None
-        vs.SUMMARY_INDEX = None
-        
-        try:
-            yield temp_locations
-        finally:
-            # Restore the original FILE_LOCATIONS and indexes
-            file_locations.FILE_LOCATIONS = original_file_locations
-            vs.CONTENT_INDEX = original_content_index
-            vs.SUMMARY_INDEX = original_summary_index
-            vs.FILE_LOCATIONS = original_vs_file_locations
+    temp_dir = str(tmp_path_factory.mktemp("rsa"))
+    # Create required prompts directory in temp directory
+    os.makedirs(os.path.join(temp_dir, 'prompts'), exist_ok=True)
+    temp_locations = file_locations.FileLocations.get_locations(temp_dir)
+
+    monkeypatch.setattr(file_locations, 'FILE_LOCATIONS', temp_locations)
+    monkeypatch.setattr(vs, 'FILE_LOCATIONS', temp_locations)
+    # Reset the global indexes to None so they get reinitialized
+    monkeypatch.setattr(vs, 'CONTENT_INDEX', None)
+    monkeypatch.setattr(vs, 'SUMMARY_INDEX', None)
+    # Index and search locally instead of calling the embedding API
+    monkeypatch.setattr(Settings, 'embed_model', fake_embed_model)
+    return temp_locations
+
+
+@pytest.fixture(scope="session")
+def cached_arxiv_paper(tmp_path_factory):
+    """Fetch the example paper's metadata and PDF from ArXiv and extract its
+    text once per session. Returns the metadata and the locations of the
+    session's copy."""
+    from my_research_assistant.arxiv_downloader import get_paper_metadata, download_paper
+    cache_locations = file_locations.FileLocations.get_locations(str(tmp_path_factory.mktemp("arxiv_cache")))
+    md = get_paper_metadata(EXAMPLE_PAPER_ID, cache_locations)
+    download_paper(md, cache_locations)
+    vs.parse_file(md, cache_locations)
+    return md, cache_locations
+
 
+@pytest.fixture
+def downloaded_paper(cached_arxiv_paper, temp_file_locations):
+    """The example paper, with its cached metadata and PDF copied into the
+    test's own locations as if it had just been downloaded there."""
+    md, cache_locations = cached_arxiv_paper
+    temp_file_locations.ensure_paper_metadata_dir()
+    shutil.copy(os.path.join(cache_locations.paper_metadata_dir, f"{EXAMPLE_PAPER_ID}.json"),
+                temp_file_locations.paper_metadata_dir)
+    temp_file_locations.ensure_pdfs_dir()
+    shutil.copy(md.get_local_pdf_path(cache_locations), md.get_local_pdf_path(temp_file_locations))
+    return md
 
+
+@pytest.fixture
+def example_paper(downloaded_paper, cached_arxiv_paper, temp_file_locations):
+    """The downloaded example paper plus its cached extracted text, so that
+    indexing it reads the text instead of parsing the PDF again."""
+    _, cache_locations = cached_arxiv_paper
+    temp_file_locations.ensure_extracted_paper_text_dir()
+    shutil.copy(os.path.join(cache_locations.extracted_paper_text_dir, f"{EXAMPLE_PAPER_ID}.md"),
+                temp_file_locations.extracted_paper_text_dir)
+    return downloaded_paper
+
+
+@pytest.fixture
+def indexed_paper(example_paper, temp_file_locations):
+    """The example paper, indexed into the test's own locations. Its text
+    comes from the session cache and is embedded with the FakeEmbedding, so
+    indexing it is local and cheap."""
+    vs.index_file(example_paper, temp_file_locations)
+    return example_paper
+
+
+@pytest.mark.integration
 def test_pdf_download(temp_file_locations):
     """Download the pdf for an arxiv paper and validate some of its metadata"""
     from my_research_assistant.arxiv_downloader import get_paper_metadata, download_paper
@@ -63,15 +94,65 @@ def test_pdf_download(temp_file_locations):
     assert exists(expected_path)
 
 
-def test_pdf_index(temp_file_locations):
-    from my_research_assistant.arxiv_downloader import get_paper_metadata, download_paper
-    md = get_paper_metadata(EXAMPLE_PAPER_ID)
-    download_paper(md, temp_file_locations)
+def test_export_pdf_url():
+    """PDF urls on the main arxiv host are rewritten to the export mirror"""
+    from my_research_assistant.arxiv_downloader import _export_pdf_url
+    assert _export_pdf_url('http://arxiv.org/pdf/2503.22738v1') == 'https://export.arxiv.org/pdf/2503.22738v1'
+    assert _export_pdf_url('https://example.com/paper.pdf') == 'https://example.com/paper.pdf'
+
+
+def test_pdf_download_failure_leaves_no_file(temp_file_locations):
+    """A failed download must not leave a partial PDF that would be treated as downloaded"""
+    from unittest.mock import patch, MagicMock
+    import datetime
+    import requests
+    from my_research_assistant.arxiv_downloader import download_paper
+    from my_research_assistant.project_types import PaperMetadata
+    md = PaperMetadata(paper_id=EXAMPLE_PAPER_ID, title="Test", published=datetime.datetime(2025, 3, 28),
+                       updated=None, paper_abs_url='http://arxiv.org/abs/2503.22738v1',
+                       paper_pdf_url='http://arxiv.org/pdf/2503.22738v1', authors=[], abstract=None,
+                       categories=[], doi=None, journal_ref=None)
+    response = MagicMock()
+    response.__enter__.return_value = response
+    response.iter_content.side_effect = requests.ConnectionError("connection reset")
+
+    with patch('my_research_assistant.arxiv_downloader._HTTP_SESSION.get', return_value=response) as mock_get:
+        with pytest.raises(requests.ConnectionError):
+            download_paper(md, temp_file_locations)
+
+    assert mock_get.call_args.args[0] == 'https://export.arxiv.org/pdf/2503.22738v1'
+    assert os.listdir(temp_file_locations.pdfs_dir) == []
+
+
+def test_load_cached_paper_metadata(temp_file_locations):
+    """Only requested papers with a readable metadata cache file are returned"""
+    import json
+    import datetime
+    from my_research_assistant.arxiv_downloader import load_cached_paper_metadata
+    from my_research_assistant.project_types import PaperMetadata
+    temp_file_locations.ensure_paper_metadata_dir()
+    for paper_id in ('2503.22738', '2412.19437v2'):
+        md = PaperMetadata(paper_id=paper_id, title=f"Paper {paper_id}", published=datetime.datetime(2025, 3, 28),
+                           updated=None, paper_abs_url=f'http://arxiv.org/abs/{paper_id}',
+                           paper_pdf_url=f'http://arxiv.org/pdf/{paper_id}', authors=[], abstract=None,
+                           categories=[], doi=None, journal_ref=None)
+        with open(os.path.join(temp_file_locations.paper_metadata_dir, f"{paper_id}.json"), 'w') as f:
+            json.dump(md.model_dump(), f, default=str)
+    with open(os.path.join(temp_file_locations.paper_metadata_dir, "2507.20534v1.json"), 'w') as f:
+        f.write("{not json")
+
+    found = load_cached_paper_metadata(['2503.22738', '2507.20534v1', '2501.00001'], temp_file_locations)
+
+    assert list(found) == ['2503.22738']
+    assert found['2503.22738'].title == "Paper 2503.22738"
+
+
+@pytest.mark.integration
+def test_pdf_index(temp_file_locations, example_paper):
+    md = example_paper
     assert exists(md.get_local_pdf_path(temp_file_locations))
     
-    # Import and patch the vector_store module to use our temp locations
     import my_research_assistant.vector_store as vs
-    vs.FILE_LOCATIONS = temp_file_locations  # Override the imported FILE_LOCATIONS
     
     vs.index_file(md, temp_file_locations)
     rtr = vs.CONTENT_INDEX.as_retriever()
@@ -79,22 +160,19 @@ def test_pdf_index(temp_file_locations):
     print(response)
 
 
-def test_rebuild_index(temp_file_locations):
+@pytest.mark.integration
+def test_rebuild_index(temp_file_locations, example_paper):
     """Test the rebuild_index function with multiple papers"""
     import pytest
     from my_research_assistant.arxiv_downloader import get_paper_metadata, download_paper
     import my_research_assistant.vector_store as vs
     from os.path import exists, isdir
     
-    # Override the imported FILE_LOCATIONS
-    vs.FILE_LOCATIONS = temp_file_locations
-    
     # Download a couple of papers for testing
     paper1_id = '2503.22738'
     paper2_id = '2503.00237'  # Another paper that should be available
     
-    md1 = get_paper_metadata(paper1_id)
-    download_paper(md1, temp_file_locations)
+    md1 = example_paper
     assert exists(md1.get_local_pdf_path(temp_file_locations))
     
     # Try to download second paper, but handle if it fails gracefully
@@ -131,24 +209,17 @@ def test_rebuild_index(temp_file_locations):
             raise
 
 
-def test_search_index_with_results(temp_file_locations):
+@pytest.mark.integration
+def test_search_index_with_results(temp_file_locations, indexed_paper):
     """Test search_index function with documents that should return results"""
-    from my_research_assistant.arxiv_downloader import get_paper_metadata, download_paper
     import my_research_assistant.vector_store as vs
     from os.path import exists
     
-    # Override the imported FILE_LOCATIONS
-    vs.FILE_LOCATIONS = temp_file_locations
-    
-    # Download and index a paper
+    # The paper is downloaded and indexed by the indexed_paper fixture
     paper_id = '2503.22738'
-    md = get_paper_metadata(paper_id)
-    download_paper(md, temp_file_locations)
+    md = indexed_paper
     assert exists(md.get_local_pdf_path(temp_file_locations))
     
-    # Index the paper
-    vs.index_file(md, temp_file_locations)
-    
     # Test search functionality
     results = vs.search_index('shielding agents', k=3, file_locations=temp_file_locations)
     
@@ -171,20 +242,15 @@ def test_search_index_with_results(temp_file_locations):
         assert len(result.chunk) > 0
 
 
-def test_search_index_different_k_values(temp_file_locations):
+@pytest.mark.integration
+def test_search_index_different_k_values(temp_file_locations, indexed_paper):
     """Test search_index with different k values"""
-    from my_research_assistant.arxiv_downloader import get_paper_metadata, download_paper
     import my_research_assistant.vector_store as vs
     from os.path import exists
     
-    # Override the imported FILE_LOCATIONS
-    vs.FILE_LOCATIONS = temp_file_locations
-    
-    # Download and index a paper
+    # The paper is downloaded and indexed by the indexed_paper fixture
     paper_id = '2503.22738'
-    md = get_paper_metadata(paper_id)
-    download_paper(md, temp_file_locations)
-    vs.index_file(md, temp_file_locations)
+    md = indexed_paper
     
     # Test with different k values
     # After fixing the ChromaDB ordering bug, MMR now correctly preserves the top result
@@ -203,20 +269,15 @@ def test_search_index_different_k_values(temp_file_locations):
         assert results_k1[0].chunk == results_k5[0].chunk
 
 
-def test_search_index_no_results_query(temp_file_locations):
+@pytest.mark.integration
+def test_search_index_no_results_query(temp_file_locations, indexed_paper):
     """Test search_index with a query that should return no or few results"""
-    from my_research_assistant.arxiv_downloader import get_paper_metadata, download_paper
     import my_research_assistant.vector_store as vs
     from os.path import exists
     
-    # Override the imported FILE_LOCATIONS
-    vs.FILE_LOCATIONS = temp_file_locations
-    
-    # Download and index a paper
+    # The paper is downloaded and indexed by the indexed_paper fixture
     paper_id = '2503.22738'
-    md = get_paper_metadata(paper_id)
-    download_paper(md, temp_file_locations)
-    vs.index_file(md, temp_file_locations)
+    md = indexed_paper
     
     # Test with a very specific query that's unlikely to match
     results = vs.search_index('quantum computing blockchain cryptocurrency', k=5, file_locations=temp_file_locations)
@@ -230,8 +291,7 @@ def test_search_index_no_database_error(temp_file_locations):
     """Test search_index when no database exists - should raise IndexError"""
     import my_research_assistant.vector_store as vs
     
-    # Override the imported FILE_LOCATIONS but don't create any index
-    vs.FILE_LOCATIONS = temp_file_locations
+    # Don't create any index
     vs.CONTENT_INDEX = None  # Ensure we start fresh
     
     # Should raise IndexError when no database exists
@@ -244,20 +304,15 @@ def test_search_index_no_database_error(temp_file_locations):
         assert False, f"Should have raised IndexError, got {type(e).__name__}: {e}"
 
 
-def test_search_index_summary_filename_detection(temp_file_locations):
+@pytest.mark.integration
+def test_search_index_summary_filename_detection(temp_file_locations, indexed_paper):
     """Test that search_index correctly detects if summary files exist"""
-    from my_research_assistant.arxiv_downloader import get_paper_metadata, download_paper
     import my_research_assistant.vector_store as vs
     from os.path import exists, join
     
-    # Override the imported FILE_LOCATIONS
-    vs.FILE_LOCATIONS = temp_file_locations
-    
-    # Download and index a paper
+    # The paper is downloaded and indexed by the indexed_paper fixture
     paper_id = '2503.22738'
-    md = get_paper_metadata(paper_id)
-    download_paper(md, temp_file_locations)
-    vs.index_file(md, temp_file_locations)
+    md = indexed_paper
     
     # Search without a summary file
     results_no_summary = vs.search_index('agent', k=1, file_locations=temp_file_locations)
@@ -281,19 +336,15 @@ def test_search_index_summary_filename_detection(temp_file_locations):
             f"Should detect summary file {expected_summary_filename}"
 
 
-def test_index_file_using_pymupdf_parser(temp_file_locations):
+@pytest.mark.integration
+def test_index_file_using_pymupdf_parser(temp_file_locations, example_paper):
     """Test the index_file_using_pymupdf_parser function"""
-    from my_research_assistant.arxiv_downloader import get_paper_metadata, download_paper
     import my_research_assistant.vector_store as vs
     from os.path import exists
     
-    # Override the imported FILE_LOCATIONS
-    vs.FILE_LOCATIONS = temp_file_locations
-    
     # Download a paper for testing
     paper_id = '2503.22738'
-    md = get_paper_metadata(paper_id)
-    download_paper(md, temp_file_locations)
+    md = example_paper
     assert exists(md.get_local_pdf_path(temp_file_locations))
     
     # Test the PyMuPDF parser indexing function
@@ -335,19 +386,15 @@ def test_index_file_using_pymupdf_parser(temp_file_locations):
     assert len(result.chunk) > 0
 
 
-def test_parse_file_caching(temp_file_locations):
+@pytest.mark.integration
+def test_parse_file_caching(temp_file_locations, downloaded_paper):
     """Test that parse_file caches extracted text and loads from cache on subsequent calls"""
-    from my_research_assistant.arxiv_downloader import get_paper_metadata, download_paper
     import my_research_assistant.vector_store as vs
     from os.path import exists, join
 
-    # Override the imported FILE_LOCATIONS
-    vs.FILE_LOCATIONS = temp_file_locations
-
     # Download a paper for testing
     paper_id = '2503.22738'
-    md = get_paper_metadata(paper_id)
-    download_paper(md, temp_file_locations)
+    md = downloaded_paper
     assert exists(md.get_local_pdf_path(temp_file_locations))
 
     # Verify the cache file doesn't exist yet
@@ -371,16 +418,15 @@ def test_parse_file_caching(temp_file_locations):
     assert cached_content == paper_text1, "Cache file should contain the extracted text"
 
 
-def test_index_summary_basic(temp_file_locations):
+@pytest.mark.integration
+def test_index_summary_basic(temp_file_locations, example_paper):
     """Test basic summary indexing functionality."""
-    from my_research_assistant.arxiv_downloader import get_paper_metadata
     import my_research_assistant.vector_store as vs
     from os.path import join
 
-    vs.FILE_LOCATIONS = temp_file_locations
 
     # Get paper metadata
-    md = get_paper_metadata(EXAMPLE_PAPER_ID)
+    md = example_paper
 
     # Create a summary file
     temp_file_locations.ensure_summaries_dir()
@@ -422,15 +468,14 @@ This paper introduces ShieldAgent, a framework for agent safety.
     assert found_summary, "Should find summary with proper metadata"
 
 
-def test_index_summary_idempotency(temp_file_locations):
+@pytest.mark.integration
+def test_index_summary_idempotency(temp_file_locations, example_paper):
     """Test that index_summary is idempotent - indexing twice doesn't duplicate."""
-    from my_research_assistant.arxiv_downloader import get_paper_metadata
     import my_research_assistant.vector_store as vs
     from os.path import join
 
-    vs.FILE_LOCATIONS = temp_file_locations
 
-    md = get_paper_metadata(EXAMPLE_PAPER_ID)
+    md = example_paper
 
     # Create a summary file
     temp_file_locations.ensure_summaries_dir()
@@ -455,14 +500,13 @@ def test_index_summary_idempotency(temp_file_locations):
     assert summary_count > 0, "Should have summary indexed"
 
 
-def test_index_summary_missing_file(temp_file_locations):
+@pytest.mark.integration
+def test_index_summary_missing_file(temp_file_locations, example_paper):
     """Test that index_summary raises error when summary file doesn't exist."""
-    from my_research_assistant.arxiv_downloader import get_paper_metadata
     import my_research_assistant.vector_store as vs
 
-    vs.FILE_LOCATIONS = temp_file_locations
 
-    md = get_paper_metadata(EXAMPLE_PAPER_ID)
+    md = example_paper
 
     # Don't create summary file - should raise error
     with pytest.raises(vs.IndexError) as exc_info:
@@ -471,15 +515,14 @@ def test_index_summary_missing_file(temp_file_locations):
     assert "Summary file not found" in str(exc_info.value)
 
 
-def test_index_summary_metadata_validation(temp_file_locations):
+@pytest.mark.integration
+def test_index_summary_metadata_validation(temp_file_locations, example_paper):
     """Test that summaries have all required metadata fields."""
-    from my_research_assistant.arxiv_downloader import get_paper_metadata
     import my_research_assistant.vector_store as vs
     from os.path import join
 
-    vs.FILE_LOCATIONS = temp_file_locations
 
-    md = get_paper_metadata(EXAMPLE_PAPER_ID)
+    md = example_paper
 
     # Create summary
     temp_file_locations.ensure_summaries_dir()
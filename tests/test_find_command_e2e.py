@@ -155,6 +155,9 @@ class TestFindCommandE2E:
         # Verify paper_ids in result match
         assert result.paper_ids == expected_order
 
+        # The workflow's final status is shown once through the interface
+        mock_interface.show_info.assert_called_once_with(result.message)
+
         # Verify interface.display_papers was called with sorted papers
         mock_interface.display_papers.assert_called_once()
         displayed_papers = mock_interface.display_papers.call_args[0][0]
@@ -325,6 +328,9 @@ class TestFindCommandE2E:
         assert result.paper_ids == []
         assert "No papers found" in result.message
 
+        # The failure was already reported by the search step; it is not repeated as info
+        mock_interface.show_info.assert_not_called()
+
     @pytest.mark.asyncio
     @patch('my_research_assistant.google_search.API_KEY', 'test_key')
     @patch('my_research_assistant.google_search.SEARCH_ENGINE_ID', 'test_engine_id')
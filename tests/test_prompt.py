@@ -207,6 +207,17 @@ class TestIntegration:
         assert "Experiments" in result
         assert "Related work" in result
     
+    def test_summary_v3_prompts_share_paper_text_prefix(self):
+        """Test that the v3 summary and improve prompts start with the same paper text block."""
+        text = "Full paper text"
+        base = subst_prompt("base-summary-v3", text_block=text)
+        improved = subst_prompt("improve-summary-v3", text_block=text,
+                                feedback="Make it shorter", previous_summary="# Old")
+
+        prefix = base[:base.index(text) + len(text)]
+        assert improved.startswith(prefix)
+        assert improved.index("# Old") < improved.index("Make it shorter")
+
     def test_multiple_actual_prompts(self):
         """Test combining multiple actual prompt files."""
         result = subst_prompts(
@@ -257,6 +257,22 @@ async def test_research_query_success(mock_llm, mock_interface, temp_file_locati
         assert summary_call.kwargs['similarity_cutoff'] == 0.5
 
 
+@pytest.mark.asyncio
+async def test_research_query_keeps_summary_ranking_order(mock_llm, mock_interface, temp_file_locations,
+                                                          sample_search_results, sample_papers):
+    """Test that Stage 2 searches papers in the order the summary search ranked them."""
+    runner = WorkflowRunner(mock_llm, mock_interface, temp_file_locations)
+    ranked = [sample_search_results[2], sample_search_results[0], sample_search_results[1]]
+
+    with patch('my_research_assistant.vector_store.search_summary_index', return_value=ranked), \
+         patch('my_research_assistant.vector_store.search_content_index_filtered',
+               return_value=sample_search_results) as mock_content_search, \
+         patch('my_research_assistant.paper_manager.get_papers_by_ids', return_value=sample_papers):
+        await runner.research_query("How do multi-agent systems improve AI safety?")
+
+    assert mock_content_search.call_args.kwargs['paper_ids'] == ["2503.22739", "2503.22738"]
+
+
 @pytest.mark.asyncio
 async def test_research_query_no_papers_found(mock_llm, mock_interface, temp_file_locations):
     """Test research query when no papers are found."""
@@ -296,6 +312,51 @@ async def test_research_query_fallback_to_summaries(mock_llm, mock_interface, te
         assert len(result.papers) > 0
 
 
+@pytest.mark.asyncio
+async def test_research_query_exact_summary_match_skips_synthesis(mock_llm, mock_interface, temp_file_locations,
+                                                                  sample_search_results, sample_papers):
+    """Test a single near-exact summary hit returns that paper's summary without detail search or LLM."""
+    runner = WorkflowRunner(mock_llm, mock_interface, temp_file_locations)
+    exact_hit = sample_search_results[0].model_copy(update={'similarity_score': 0.97})
+    temp_file_locations.ensure_summaries_dir()
+    with open(os.path.join(temp_file_locations.summaries_dir, "2503.22738.md"), 'w') as f:
+        f.write("## ShieldAgent summary")
+
+    with patch('my_research_assistant.vector_store.search_summary_index', return_value=[exact_hit]), \
+         patch('my_research_assistant.vector_store.search_content_index_filtered') as mock_content_search, \
+         patch('my_research_assistant.paper_manager.get_papers_by_ids', return_value=sample_papers[:1]):
+        result = await runner.research_query("What is ShieldAgent?", num_summary_papers=1)
+
+    assert result.success is True
+    assert result.paper_ids == ["2503.22738"]
+    assert "## ShieldAgent summary" in result.content
+    mock_content_search.assert_not_called()
+    mock_llm.acomplete.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_research_query_streams_synthesis(mock_llm, mock_interface, temp_file_locations,
+                                                sample_search_results, sample_papers):
+    """Test research query streams the synthesis to on_chunk and still includes it in the result."""
+    async def stream():
+        for delta in ["## Overview\n", "Streamed synthesis."]:
+            yield Mock(delta=delta)
+
+    mock_llm.astream_complete = AsyncMock(return_value=stream())
+    runner = WorkflowRunner(mock_llm, mock_interface, temp_file_locations)
+
+    received = []
+    with patch('my_research_assistant.vector_store.search_summary_index', return_value=sample_search_results), \
+         patch('my_research_assistant.vector_store.search_content_index_filtered', return_value=sample_search_results), \
+         patch('my_research_assistant.paper_manager.get_papers_by_ids', return_value=sample_papers):
+        result = await runner.research_query("Test query", on_chunk=received.append)
+
+    assert result.success is True
+    assert received == ["## Overview\n", "Streamed synthesis."]
+    assert "Streamed synthesis." in result.content
+    mock_llm.acomplete.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_research_query_custom_parameters(mock_llm, mock_interface, temp_file_locations,
                                                sample_search_results, sample_papers):
@@ -486,6 +547,28 @@ async def test_research_query_uses_prompt_template(mock_llm, mock_interface, tem
         assert "Relevant Excerpts:" in prompt_used
 
 
+def test_build_research_context_groups_excerpts_by_paper():
+    """Test that excerpts are grouped under their paper and numbered per paper."""
+    from my_research_assistant.workflow import _build_research_context
+
+    def result(paper_id, page, chunk):
+        return SearchResult(paper_id=paper_id, pdf_filename=f"{paper_id}.pdf", summary_filename=None,
+                            paper_title=f"Paper {paper_id}", page=page, chunk=chunk, similarity_score=0.9)
+
+    papers_context, context_text = _build_research_context(
+        [result("a", 1, "first a"), result("b", 2, "only b"), result("a", 5, "second a")])
+
+    assert context_text == (
+        "\n### Paper: Paper a (ArXiv ID: a)\n\n"
+        "**Excerpt 1** (Page 1):\nfirst a\n\n"
+        "**Excerpt 2** (Page 5):\nsecond a\n\n"
+        "\n### Paper: Paper b (ArXiv ID: b)\n\n"
+        "**Excerpt 1** (Page 2):\nonly b\n\n"
+    )
+    assert list(papers_context) == ["a", "b"]
+    assert papers_context["a"] == {'title': "Paper a", 'pages': {1, 5}}
+
+
 # ===== VECTOR STORE FUNCTION TESTS =====
 
 def test_search_summary_index_with_mmr(temp_file_locations):
@@ -2,7 +2,7 @@
 
 import pytest
 import asyncio
-from unittest.mock import Mock, AsyncMock, patch
+from unittest.mock import Mock, MagicMock, AsyncMock, patch
 
 from my_research_assistant.workflow import WorkflowRunner, QueryResult
 from my_research_assistant.vector_store import search_index, _retrieve_with_manual_diversity
@@ -97,7 +97,6 @@ class TestSemanticSearchWorkflow:
 
         # Create workflow runner
         runner = WorkflowRunner(mock_llm, mock_interface)
-
         # Mock the search_index function to return diverse results
         # Patch at the vector_store module level since it's imported inside the function
         with patch('my_research_assistant.vector_store.search_index') as mock_search:
@@ -124,6 +123,13 @@ class TestSemanticSearchWorkflow:
             assert call_args[1]['k'] == 20
             assert call_args[1]['similarity_cutoff'] == 0.6
 
+            # Static instructions lead the prompt, ahead of the per-query text
+            prompt = mock_llm.acomplete.call_args.args[0]
+            assert prompt.startswith("You are a research assistant")
+            assert (prompt.index("INSTRUCTIONS:")
+                    < prompt.index("QUESTION: compare deepseek v3 and kimi k2")
+                    < prompt.index("RETRIEVED PASSAGES:"))
+
     @pytest.mark.asyncio
     async def test_semantic_search_handles_diverse_results(self):
         """Test that when diverse results are found, both papers are included in the response."""
@@ -169,7 +175,6 @@ Both models demonstrate significant advances in their respective areas."""
         ]
 
         runner = WorkflowRunner(mock_llm, mock_interface)
-
         with patch('my_research_assistant.vector_store.search_index') as mock_search:
             mock_search.return_value = diverse_results
 
@@ -187,6 +192,105 @@ Both models demonstrate significant advances in their respective areas."""
             assert "deepseek" in content_lower or "deepseek-v3" in content_lower
             assert "kimi" in content_lower
 
+    @pytest.mark.asyncio
+    async def test_repeated_query_uses_cache_until_index_changes(self):
+        """Test that a repeated query skips search and the LLM until the index changes."""
+        from my_research_assistant import vector_store
+
+        mock_interface = Mock(spec=TerminalAdapter)
+        mock_llm = AsyncMock()
+        mock_llm.acomplete = AsyncMock(return_value=Mock(text="DeepSeek-V3 is a mixture-of-experts model."))
+        results = [
+            SearchResult(
+                paper_id="2412.19437v2",
+                pdf_filename="2412.19437v2.pdf",
+                summary_filename=None,
+                paper_title="DeepSeek-V3 Technical Report",
+                page=1,
+                chunk="DeepSeek-V3 is a powerful language model...",
+                similarity_score=0.9234
+            )
+        ]
+
+        runner = WorkflowRunner(mock_llm, mock_interface)
+        with patch('my_research_assistant.vector_store.search_index', return_value=results) as mock_search:
+            first = await runner.start_semantic_search_workflow("what is deepseek v3")
+            received = []
+            second = await runner.start_semantic_search_workflow("  What is DeepSeek V3 ", on_chunk=received.append)
+            assert second is first
+            assert received == [first.content]
+            assert mock_search.call_count == 1
+            assert mock_llm.acomplete.call_count == 1
+
+            # A different question is answered afresh, however similar it is
+            await runner.start_semantic_search_workflow("what is deepseek v2")
+            assert mock_search.call_count == 2
+            assert mock_llm.acomplete.call_count == 2
+
+            vector_store.bump_index_generation()
+            third = await runner.start_semantic_search_workflow("what is deepseek v3")
+            assert third.success is True
+            assert mock_search.call_count == 3
+            assert mock_llm.acomplete.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_answer_streams_to_callback(self):
+        """Test that the RAG answer is streamed to on_chunk and still included in the result."""
+        async def stream():
+            for delta in ["DeepSeek-V3 is", " a mixture-of-experts model."]:
+                yield Mock(delta=delta)
+
+        mock_interface = Mock(spec=TerminalAdapter)
+        mock_llm = AsyncMock()
+        mock_llm.astream_complete = AsyncMock(return_value=stream())
+        results = [
+            SearchResult(
+                paper_id="2412.19437v2",
+                pdf_filename="2412.19437v2.pdf",
+                summary_filename=None,
+                paper_title="DeepSeek-V3 Technical Report",
+                page=1,
+                chunk="DeepSeek-V3 is a powerful language model...",
+                similarity_score=0.9234
+            )
+        ]
+
+        runner = WorkflowRunner(mock_llm, mock_interface)
+        received = []
+        with patch('my_research_assistant.vector_store.search_index', return_value=results):
+            result = await runner.start_semantic_search_workflow("what is deepseek v3", on_chunk=received.append)
+
+        assert received == ["DeepSeek-V3 is", " a mixture-of-experts model."]
+        assert "DeepSeek-V3 is a mixture-of-experts model." in result.content
+        mock_llm.acomplete.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_insufficient_answer_detected_case_insensitively(self):
+        """Test that an answer admitting missing information is reported as unsuccessful."""
+        mock_interface = Mock(spec=TerminalAdapter)
+        mock_llm = AsyncMock()
+        mock_llm.acomplete = AsyncMock(return_value=Mock(
+            text="Unfortunately, this Cannot Be Answered Based On the provided excerpts."))
+        results = [
+            SearchResult(
+                paper_id="2412.19437v2",
+                pdf_filename="2412.19437v2.pdf",
+                summary_filename=None,
+                paper_title="DeepSeek-V3 Technical Report",
+                page=1,
+                chunk="DeepSeek-V3 is a powerful language model...",
+                similarity_score=0.9234
+            )
+        ]
+
+        runner = WorkflowRunner(mock_llm, mock_interface)
+        with patch('my_research_assistant.vector_store.search_index', return_value=results):
+            result = await runner.start_semantic_search_workflow("who won the 1998 world cup")
+
+        assert result.success is False
+        assert result.message == "Insufficient information to answer"
+        assert result.paper_ids == ["2412.19437v2"]
+
 
 class TestSemanticSearchDisplay:
     """Test that semantic search results are properly displayed in chat interface."""
@@ -211,7 +315,7 @@ class TestSemanticSearchDisplay:
         mock_workflow_runner.start_semantic_search_workflow = AsyncMock(return_value=mock_result)
 
         # Mock interface adapter and state machine
-        mock_interface = Mock()
+        mock_interface = MagicMock()
         mock_state_machine = Mock()
 
         # Inject mocks
@@ -224,6 +328,11 @@ class TestSemanticSearchDisplay:
         # Test semantic search command
         await chat.process_semantic_search_command("compare deepseek v3 and kimi k2")
 
+        # The answer is streamed through the interface adapter
+        on_chunk = mock_interface.stream_context.return_value.__enter__.return_value
+        mock_workflow_runner.start_semantic_search_workflow.assert_called_once_with(
+            "compare deepseek v3 and kimi k2", on_chunk=on_chunk)
+
         # Verify result was displayed
         chat.render_markdown_response.assert_called_once_with(mock_result.content)
         chat.add_to_history.assert_called_once_with("assistant", mock_result.content)
@@ -255,7 +364,7 @@ class TestSemanticSearchDisplay:
         mock_workflow_runner.start_semantic_search_workflow = AsyncMock(return_value=mock_failed_result)
 
         # Mock interface and state machine
-        mock_interface = Mock()
+        mock_interface = MagicMock()
         mock_state_machine = Mock()
 
         chat.workflow_runner = mock_workflow_runner
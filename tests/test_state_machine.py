@@ -602,6 +602,7 @@ class TestSummaryCommandEnhancements:
             mock_result = Mock()
             mock_result.paper = mock_paper
             mock_result.summary = "Generated test summary content"
+            mock_result.error = None
 
             # Mock the paper argument parsing, summary loading, and paper processing
             with patch('my_research_assistant.paper_manager.parse_paper_argument_enhanced', return_value=(mock_paper, '', False)):
@@ -56,7 +56,7 @@ class TestSummarizePaper:
         result = summarize_paper(text, sample_paper_metadata)
 
         # Assertions
-        mock_subst_prompt.assert_called_once_with('base-summary-v2', text_block=text)
+        mock_subst_prompt.assert_called_once_with('base-summary-v3', text_block=text)
         mock_get_model.assert_called_once()
         mock_llm.complete.assert_called_once_with("Test prompt")
         
@@ -89,7 +89,7 @@ class TestSummarizePaper:
 
         # Assertions
         mock_subst_prompt.assert_called_once_with(
-            'improve-summary-v2',
+            'improve-summary-v3',
             feedback=feedback,
             previous_summary=previous_summary,
             text_block=text
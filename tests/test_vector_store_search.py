@@ -241,6 +241,98 @@ This paper introduces ShieldAgent, a framework for ensuring agent safety through
 
         assert "No existing ChromaDB found" in str(exc_info.value)
 
+    def test_warm_indexes_without_database(self, temp_file_locations):
+        """Test that warm_indexes leaves missing indexes unloaded instead of creating them."""
+        import my_research_assistant.vector_store as vs
+
+        vs.CONTENT_INDEX = None
+        vs.SUMMARY_INDEX = None
+
+        vs.warm_indexes(temp_file_locations)
+
+        assert vs.CONTENT_INDEX is None
+        assert vs.SUMMARY_INDEX is None
+        assert not os.path.exists(vs._get_chroma_db_path(temp_file_locations, "summary"))
+
+    def test_add_documents_to_index_embeds_in_one_batch(self, monkeypatch):
+        """Test that all of a paper's documents are embedded with one batched request."""
+        import my_research_assistant.vector_store as vs
+        from llama_index.core import Settings, VectorStoreIndex
+        from llama_index.core.embeddings import MockEmbedding
+        from llama_index.core.schema import Document
+
+        class CountingEmbedding(MockEmbedding):
+            batch_calls: int = 0
+
+            def _get_text_embeddings(self, texts):
+                self.batch_calls += 1
+                return super()._get_text_embeddings(texts)
+
+        embed_model = CountingEmbedding(embed_dim=8, embed_batch_size=100)
+        monkeypatch.setattr(Settings, 'embed_model', embed_model)
+        index = VectorStoreIndex([])
+        docs = [Document(text=f"Page {i} text.", metadata={'page': i}) for i in range(1, 4)]
+
+        vs._add_documents_to_index(docs, create_mock_metadata(EXAMPLE_PAPER_ID), index, "content")
+
+        assert embed_model.batch_calls == 1
+        assert len(index.index_struct.nodes_dict) == 3
+        assert [doc.metadata['page_label'] for doc in docs] == ['1', '2', '3']
+        assert all(doc.metadata['paper_id'] == EXAMPLE_PAPER_ID for doc in docs)
+
+    def test_add_documents_to_index_writes_chroma_in_one_batch(self, fake_embed_model, monkeypatch):
+        """Test that all of a paper's chunks are written to Chroma with one collection.add call."""
+        import uuid
+        import chromadb
+        import my_research_assistant.vector_store as vs
+        from llama_index.core import Settings, StorageContext, VectorStoreIndex
+        from llama_index.core.ingestion import run_transformations
+        from llama_index.core.schema import Document
+        from llama_index.vector_stores.chroma import ChromaVectorStore
+
+        monkeypatch.setattr(Settings, 'embed_model', fake_embed_model)
+        collection = chromadb.EphemeralClient().get_or_create_collection(f"test_{uuid.uuid4().hex}")
+        storage_context = StorageContext.from_defaults(vector_store=ChromaVectorStore(chroma_collection=collection))
+        index = VectorStoreIndex([], storage_context=storage_context)
+        # Pages of roughly 3000 tokens, so that each one is split into several chunks
+        docs = [Document(text=f"Page {i} text. " * 600, metadata={'page': i}) for i in range(1, 6)]
+
+        chunked = []
+        def record_transformations(*args, **kwargs):
+            nodes = run_transformations(*args, **kwargs)
+            chunked.extend(nodes)
+            return nodes
+
+        with patch.object(vs, 'run_transformations', side_effect=record_transformations), \
+             patch.object(collection, 'add', wraps=collection.add) as add_spy:
+            vs._add_documents_to_index(docs, create_mock_metadata(EXAMPLE_PAPER_ID), index, "content")
+
+        assert len(chunked) > len(docs)
+        assert add_spy.call_count == 1
+        assert add_spy.call_args.kwargs['ids'] == [node.node_id for node in chunked]
+        assert collection.count() == len(chunked)
+
+    def test_embed_nodes_concurrently_keeps_batch_order(self):
+        """Test that multi-batch embeddings are assigned back to the right nodes."""
+        import my_research_assistant.vector_store as vs
+        from llama_index.core.embeddings import MockEmbedding
+        from llama_index.core.schema import TextNode
+
+        class IndexEmbedding(MockEmbedding):
+            batch_sizes: list = []
+
+            def _get_text_embeddings(self, texts):
+                self.batch_sizes.append(len(texts))
+                return [[float(text.split()[1])] * 8 for text in texts]
+
+        embed_model = IndexEmbedding(embed_dim=8, embed_batch_size=2)
+        nodes = [TextNode(text=f"Chunk {i}") for i in range(5)]
+
+        vs._embed_nodes_concurrently(nodes, embed_model)
+
+        assert sorted(embed_model.batch_sizes) == [1, 2, 2]
+        assert [node.embedding[0] for node in nodes] == [0.0, 1.0, 2.0, 3.0, 4.0]
+
     def test_search_summary_index_with_mmr(self, temp_file_locations):
         """Test summary search with MMR enabled."""
         import my_research_assistant.vector_store as vs
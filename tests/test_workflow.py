@@ -2,8 +2,10 @@
 
 import pytest
 import asyncio
+import os
 import tempfile
-from unittest.mock import Mock, patch, AsyncMock
+import threading
+from unittest.mock import Mock, MagicMock, patch, AsyncMock
 from datetime import datetime
 from typing import List
 
@@ -20,7 +22,9 @@ from my_research_assistant.workflow import (
     SummaryGeneratedEvent,
     SummarySavedEvent,
     SemanticSearchEvent,
-    SemanticSearchResultsEvent
+    SemanticSearchResultsEvent,
+    StatusEvent,
+    SummaryResult
 )
 from my_research_assistant.project_types import PaperMetadata
 from my_research_assistant.file_locations import FileLocations
@@ -214,6 +218,51 @@ class TestWorkflowSteps:
             assert "❌ Search failed" in result.result
             assert "API Error" in result.result
     
+    @pytest.mark.asyncio
+    async def test_search_papers_reuses_recent_results(self, workflow, sample_paper_metadata):
+        """Test that repeating a search (modulo case/whitespace) does not hit ArXiv again."""
+        with patch('my_research_assistant.workflow.search_arxiv_papers') as mock_search:
+            mock_search.return_value = [sample_paper_metadata]
+            ctx = Mock(spec=Context)
+
+            first = await workflow.search_papers_impl(ctx, "Test Query")
+            second = await workflow.search_papers_impl(ctx, "  test query ")
+            third = await workflow.search_papers_impl(ctx, "test\tQUERY")
+
+            mock_search.assert_called_once_with("Test Query", k=5)
+            assert second.papers == first.papers
+            assert third.papers == first.papers
+
+            # A different query still goes to ArXiv
+            await workflow.search_papers_impl(ctx, "other query")
+            assert mock_search.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_summarize_search_results_streams_status_event(self, workflow):
+        """Test that the progress message is streamed as a StatusEvent, not a StopEvent."""
+        ctx = Mock(spec=Context)
+        ctx.write_event_to_stream = Mock()
+
+        await workflow.summarize_search_results(ctx, SemanticSearchResultsEvent(results=[], query="q"))
+
+        status = ctx.write_event_to_stream.call_args_list[0].args[0]
+        assert isinstance(status, StatusEvent)
+        assert not isinstance(status, StopEvent)
+        assert "q" in status.message
+
+    @pytest.mark.asyncio
+    async def test_route_workflow_dispatch(self, workflow):
+        """Test routing by workflow_type, including unknown types."""
+        ctx = Mock(spec=Context)
+
+        result = await workflow.route_workflow(ctx, StartEvent(query="q", workflow_type="semantic_search"))
+        assert isinstance(result, SemanticSearchEvent)
+        assert result.query == "q"
+
+        result = await workflow.route_workflow(ctx, StartEvent(query="q", workflow_type="bogus"))
+        assert isinstance(result, StopEvent)
+        assert "Unknown workflow type: bogus" in result.result
+    
     @pytest.mark.asyncio
     async def test_handle_paper_selection_success(self, workflow, sample_paper_metadata):
         """Test successful paper selection."""
@@ -226,6 +275,21 @@ class TestWorkflowSteps:
         
         assert isinstance(result, PaperSelectedEvent)
         assert result.paper == sample_paper_metadata
+        workflow.interface.show_success.assert_called_once_with(
+            f"Selected paper: '{sample_paper_metadata.title}' by John Doe, Jane Smith"
+        )
+
+    def test_display_authors_truncates_long_lists(self, sample_paper_metadata):
+        """Test that only the first two authors are shown."""
+        paper = sample_paper_metadata.model_copy(update={'authors': ["A", "B", "C"]})
+        assert paper.display_authors == "A, B..."
+
+    def test_display_authors_with_count_and_categories(self, sample_paper_metadata):
+        """Test the listing forms of the author and category lists."""
+        paper = sample_paper_metadata.model_copy(update={'authors': ["A", "B", "C", "D"],
+                                                         'categories': ["cs.AI", "cs.CL", "cs.LG"]})
+        assert paper.display_authors_with_count == "A, B + 2 more"
+        assert paper.display_categories == "cs.AI, cs.CL..."
     
     @pytest.mark.asyncio
     async def test_handle_paper_selection_no_papers(self, workflow):
@@ -295,7 +359,7 @@ class TestWorkflowSteps:
             assert result.paper == sample_paper_metadata
             assert result.paper_text == "Sample paper text content"
             
-            mock_index.assert_called_once_with(sample_paper_metadata)
+            mock_index.assert_called_once_with(sample_paper_metadata, workflow.file_locations)
     
     @pytest.mark.asyncio
     async def test_generate_summary_step_success(self, workflow, sample_paper_metadata):
@@ -330,9 +394,9 @@ class TestWorkflowSteps:
     @pytest.mark.asyncio
     async def test_save_summary_step_success(self, workflow, sample_paper_metadata, temp_file_locations):
         """Test successful summary saving."""
-        with patch('my_research_assistant.workflow.save_summary') as mock_save:
-            expected_path = f"{temp_file_locations.summaries_dir}/2503.22738.md"
-            mock_save.return_value = expected_path
+        with patch('my_research_assistant.workflow.load_summary_index') as mock_load_index, \
+             patch('my_research_assistant.workflow.index_summary') as mock_index_summary:
+            expected_path = os.path.join(workflow.file_locations.summaries_dir, "2503.22738.md")
             
             ctx = Mock(spec=Context)
             ctx.write_event_to_stream = Mock()
@@ -349,7 +413,11 @@ class TestWorkflowSteps:
             assert "Summary saved successfully" in result.result
             assert expected_path in result.result
             
-            mock_save.assert_called_once_with("# Test Summary\nContent", "2503.22738")
+            # Written to the directory index_summary reads it from
+            with open(expected_path, encoding='utf-8') as f:
+                assert f.read() == "# Test Summary\nContent"
+            mock_load_index.assert_called_once_with(workflow.file_locations)
+            mock_index_summary.assert_called_once_with(sample_paper_metadata, workflow.file_locations)
 
 
 class TestWorkflowRunner:
@@ -374,6 +442,199 @@ class TestWorkflowRunner:
         assert hasattr(runner, 'start_semantic_search_workflow')
         assert callable(runner.start_semantic_search_workflow)
 
+    @pytest.mark.asyncio
+    async def test_save_search_results_creates_results_dir_once(self, mock_llm, mock_interface, temp_file_locations):
+        """Test that repeated saves only ensure the results directory once."""
+        mock_llm.acomplete = AsyncMock(return_value=Mock(text="Attention Mechanisms"))
+        runner = WorkflowRunner(llm=mock_llm, interface=mock_interface, file_locations=temp_file_locations)
+
+        with patch.object(FileLocations, 'ensure_results_dir', autospec=True,
+                          side_effect=FileLocations.ensure_results_dir) as mock_ensure:
+            first = await runner.save_search_results("first content", "attention", "search")
+            second = await runner.save_search_results("second content", "attention", "search")
+
+        assert first.success and second.success
+        assert mock_ensure.call_count == 1
+        with open(second.file_path, encoding='utf-8') as f:
+            assert "second content" in f.read()
+
+    @pytest.mark.asyncio
+    async def test_save_search_results_does_not_overwrite(self, mock_llm, mock_interface, temp_file_locations):
+        """Test that results whose titles clash are saved to separate files."""
+        mock_llm.acomplete = AsyncMock(return_value=Mock(text="Attention Mechanisms"))
+        runner = WorkflowRunner(llm=mock_llm, interface=mock_interface, file_locations=temp_file_locations)
+
+        first = await runner.save_search_results("first content", "attention", "search")
+        second = await runner.save_search_results("second content", "attention heads", "search")
+
+        assert first.file_path.endswith("attention-mechanisms.md")
+        assert second.file_path.endswith("attention-mechanisms-2.md")
+        assert mock_llm.acomplete.call_count == 2
+        with open(first.file_path, encoding='utf-8') as f:
+            saved = f.read()
+        assert saved.startswith("---\ntitle: Attention Mechanisms\nquery: attention\n")
+        assert saved.endswith("---\n\nfirst content\n")
+        with open(second.file_path, encoding='utf-8') as f:
+            assert "query: attention heads\n" in f.read()
+
+    @pytest.mark.asyncio
+    async def test_get_list_of_papers_skips_failed_lookups(self, mock_llm, mock_interface, temp_file_locations,
+                                                           sample_paper_metadata):
+        """Test that a paper whose metadata lookup fails is left out of the list."""
+        runner = WorkflowRunner(llm=mock_llm, interface=mock_interface, file_locations=temp_file_locations)
+
+        def get_metadata(paper_id):
+            if paper_id == "bad.id":
+                raise Exception("ArXiv unavailable")
+            return sample_paper_metadata
+
+        with patch('my_research_assistant.arxiv_downloader.get_downloaded_paper_ids',
+                   return_value=["bad.id", sample_paper_metadata.paper_id]), \
+             patch('my_research_assistant.arxiv_downloader.get_paper_metadata', side_effect=get_metadata):
+            result = await runner.get_list_of_papers()
+
+        assert result.success is True
+        assert result.paper_ids == [sample_paper_metadata.paper_id]
+
+    @pytest.mark.asyncio
+    async def test_get_list_of_papers_reuses_listing_until_pdfs_change(self, mock_llm, mock_interface,
+                                                                       temp_file_locations, sample_paper_metadata):
+        """Test that a repeat listing is served from cache and rebuilt once a paper is added."""
+        runner = WorkflowRunner(llm=mock_llm, interface=mock_interface, file_locations=temp_file_locations)
+        temp_file_locations.ensure_pdfs_dir()
+        pdfs_dir = temp_file_locations.pdfs_dir
+        open(os.path.join(pdfs_dir, f"{sample_paper_metadata.paper_id}.pdf"), 'wb').close()
+
+        with patch('my_research_assistant.arxiv_downloader.get_paper_metadata',
+                   return_value=sample_paper_metadata) as mock_get_metadata:
+            first = await runner.get_list_of_papers()
+            second = await runner.get_list_of_papers()
+            assert mock_get_metadata.call_count == 1
+            assert second.content == first.content
+            assert second.paper_ids == first.paper_ids
+
+            open(os.path.join(pdfs_dir, "2503.00002.pdf"), 'wb').close()
+            os.utime(pdfs_dir, ns=(0, os.stat(pdfs_dir).st_mtime_ns + 1))
+            await runner.get_list_of_papers()
+
+        assert mock_get_metadata.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_improve_content_streams_chunks(self, mock_llm, mock_interface, temp_file_locations):
+        """Test that improve_content forwards streamed deltas and returns the full text."""
+        async def stream():
+            for delta in ["# Improved", " results", "\n"]:
+                yield Mock(delta=delta)
+
+        mock_llm.astream_complete = AsyncMock(return_value=stream())
+        runner = WorkflowRunner(llm=mock_llm, interface=mock_interface, file_locations=temp_file_locations)
+
+        received = []
+        result = await runner.improve_content("# Old results", "be shorter", "semantic search",
+                                              "attention", on_chunk=received.append)
+
+        assert result.success
+        assert result.content == "# Improved results"
+        assert received == ["# Improved", " results", "\n"]
+
+    @pytest.mark.asyncio
+    async def test_improve_content_repeated_feedback_calls_llm(self, mock_llm, mock_interface, temp_file_locations):
+        """Test that repeating the same feedback asks the LLM for a new version each time."""
+        mock_llm.acomplete = AsyncMock(side_effect=[Mock(text="# First try"), Mock(text="# Second try")])
+        runner = WorkflowRunner(llm=mock_llm, interface=mock_interface, file_locations=temp_file_locations)
+
+        first = await runner.improve_content("# Old results", "be shorter", "research", "attention")
+        second = await runner.improve_content("# Old results", "be shorter", "research", "attention")
+
+        assert first.content == "# First try"
+        assert second.content == "# Second try"
+        assert mock_llm.acomplete.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_process_paper_selection_failure_sets_error(self, mock_llm, mock_interface,
+                                                              temp_file_locations, sample_paper_metadata):
+        """Test that a failed download returns a result with error set instead of a string."""
+        runner = WorkflowRunner(llm=mock_llm, interface=mock_interface, file_locations=temp_file_locations)
+
+        with patch('my_research_assistant.arxiv_downloader.download_paper',
+                   side_effect=OSError("connection reset")):
+            result = await runner.process_paper_selection(sample_paper_metadata)
+
+        assert result.paper == sample_paper_metadata
+        assert result.summary == ""
+        assert "connection reset" in result.error
+
+    @pytest.mark.asyncio
+    async def test_process_paper_selection_llm_failure_sets_error(self, mock_llm, mock_interface,
+                                                                  temp_file_locations, sample_paper_metadata):
+        """Test that an LLM error while summarizing is returned in error like indexing failures."""
+        runner = WorkflowRunner(llm=mock_llm, interface=mock_interface, file_locations=temp_file_locations)
+
+        with patch('my_research_assistant.arxiv_downloader.download_paper', return_value="/pdfs/p.pdf"), \
+             patch('my_research_assistant.workflow.index_file', return_value="paper text"), \
+             patch('my_research_assistant.workflow.summarize_paper', side_effect=RuntimeError("rate limited")):
+            result = await runner.process_paper_selection(sample_paper_metadata)
+
+        assert result.summary == ""
+        assert "rate limited" in result.error
+
+    @pytest.mark.asyncio
+    async def test_process_paper_selection_runs_blocking_calls_off_loop(self, mock_llm, mock_interface,
+                                                                        temp_file_locations, sample_paper_metadata):
+        """Test that downloading, indexing and summarizing a paper run in worker threads."""
+        runner = WorkflowRunner(llm=mock_llm, interface=mock_interface, file_locations=temp_file_locations)
+        loop_thread = threading.get_ident()
+        threads = []
+
+        def record(result):
+            def fn(*args, **kwargs):
+                threads.append(threading.get_ident())
+                return result
+            return fn
+
+        with patch('my_research_assistant.arxiv_downloader.download_paper', side_effect=record("/pdfs/p.pdf")), \
+             patch('my_research_assistant.workflow.index_file', side_effect=record("paper text")), \
+             patch('my_research_assistant.workflow.summarize_paper', side_effect=record("# Summary")), \
+             patch('my_research_assistant.workflow._atomic_write_text', side_effect=record(None)) as mock_write:
+            result = await runner.process_paper_selection(sample_paper_metadata)
+
+        assert result.error is None
+        assert result.summary == "# Summary"
+        assert result.paper_text == "paper text"
+        mock_write.assert_called_once_with(
+            os.path.join(temp_file_locations.summaries_dir, f"{sample_paper_metadata.paper_id}.md"), "# Summary")
+        assert len(threads) == 4
+        assert loop_thread not in threads
+
+    @pytest.mark.asyncio
+    async def test_runner_save_summary_indexes_off_loop(self, mock_llm, mock_interface,
+                                                        temp_file_locations, sample_paper_metadata):
+        """Test that saving a summary writes it and indexes it in a worker thread."""
+        runner = WorkflowRunner(llm=mock_llm, interface=mock_interface, file_locations=temp_file_locations)
+        loop_thread = threading.get_ident()
+        threads = []
+
+        with patch('my_research_assistant.workflow.index_summary',
+                   side_effect=lambda *args: threads.append(threading.get_ident())) as mock_index_summary:
+            message = await runner.save_summary(sample_paper_metadata, "# Summary", "paper text")
+
+        mock_index_summary.assert_called_once_with(sample_paper_metadata, temp_file_locations)
+        assert threads and loop_thread not in threads
+        assert os.path.exists(os.path.join(temp_file_locations.summaries_dir, "2503.22738.md"))
+        assert "saved successfully" in message
+
+    @pytest.mark.asyncio
+    async def test_improve_summary_returns_summary_result(self, mock_llm, mock_interface,
+                                                          temp_file_locations, sample_paper_metadata):
+        """Test that improve_summary passes the feedback through and returns a SummaryResult."""
+        runner = WorkflowRunner(llm=mock_llm, interface=mock_interface, file_locations=temp_file_locations)
+
+        with patch('my_research_assistant.workflow.summarize_paper', return_value="# Better summary") as mock_summarize:
+            result = await runner.improve_summary(sample_paper_metadata, "# Summary", "paper text", "shorter")
+
+        assert result == SummaryResult("# Better summary")
+        assert mock_summarize.call_args.kwargs == {'feedback': "shorter", 'previous_summary': "# Summary"}
+
 
 class TestWorkflowIntegration:
     """Integration tests for the complete workflow."""
@@ -403,6 +664,13 @@ class TestWorkflowIntegration:
             assert tool_name in workflow.tools
             assert workflow.tools[tool_name] is not None
 
+    def test_workflow_tools_shared_between_instances(self, mock_llm, mock_interface, temp_file_locations):
+        """Test that tool wrappers are built once and not per workflow instance."""
+        first = ResearchAssistantWorkflow(llm=mock_llm, interface=mock_interface, file_locations=temp_file_locations)
+        second = ResearchAssistantWorkflow(llm=mock_llm, interface=mock_interface, file_locations=temp_file_locations)
+
+        assert first.tools["download_paper"] is second.tools["download_paper"]
+
 
 @pytest.mark.integration
 class TestWorkflowEndToEnd:
@@ -469,7 +737,7 @@ Based on the retrieved passages, here is the answer to your question.
         mock_workflow_runner.start_semantic_search_workflow = AsyncMock(return_value=mock_rag_result)
 
         # Mock interface adapter
-        mock_interface = Mock()
+        mock_interface = MagicMock()
         mock_interface.render_content = Mock()
         mock_interface.show_error = Mock()
 
@@ -506,7 +774,7 @@ Based on the retrieved passages, here is the answer to your question.
         mock_workflow_runner.start_semantic_search_workflow = AsyncMock(return_value=mock_error_result)
 
         # Mock interface adapter
-        mock_interface = Mock()
+        mock_interface = MagicMock()
         mock_interface.render_content = Mock()
         mock_interface.show_error = Mock()
 
@@ -559,7 +827,7 @@ Based on comprehensive analysis of indexed papers, machine learning encompasses
         mock_workflow_runner.start_semantic_search_workflow = AsyncMock(return_value=mock_research_result)
 
         # Mock interface adapter
-        mock_interface = Mock()
+        mock_interface = MagicMock()
         mock_interface.render_content = Mock()
         mock_interface.show_error = Mock()
 
@@ -575,7 +843,8 @@ Based on comprehensive analysis of indexed papers, machine learning encompasses
         await chat.process_semantic_search_command(query)
 
         # Verify that the underlying semantic search workflow was called
-        mock_workflow_runner.start_semantic_search_workflow.assert_called_once_with("machine learning")
+        mock_workflow_runner.start_semantic_search_workflow.assert_called_once()
+        assert mock_workflow_runner.start_semantic_search_workflow.call_args.args == ("machine learning",)
 
         # Verify that the result was displayed as markdown
         mock_interface.render_content.assert_called_once_with(mock_research_result, "markdown")